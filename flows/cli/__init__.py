@@ -5,29 +5,47 @@ Provides standalone Python scripts callable by n8n for all data processing tasks
 replacing Prefect's task-based approach with direct command-line invocations.
 """
 
-from .enrich_spotify_artists_granular import (
-    IdentifyMissingArtistsCLI,
-    FetchArtistBatchCLI,
-    WriteArtistDataCLI,
-    ExtractArtistGenresCLI,
-)
-from .enrich_spotify_albums_granular import (
-    IdentifyMissingAlbumsCLI,
-    FetchAlbumBatchCLI,
-    WriteAlbumDataCLI,
-    ExtractAlbumGenresCLI,
-)
-from .enrich_mbz_artists_granular import (
-    IdentifyMissingMBZArtistsCLI,
-    FetchMBZArtistBatchCLI,
-    TrackMBZFailuresCLI,
-)
-from .enrich_geography_base import EnrichGeographyBaseCLI
-from .enrich_geography_coordinates_granular import (
-    IdentifyCitiesNeedingCoordinatesCLI,
-    FetchCoordinateBatchCLI,
-    WriteCoordinateDataCLI,
-)
+import importlib
+
+# Exported command classes and the submodule defining each. They are
+# imported on first access so that loading one command (e.g. run_dbt from
+# an n8n Code node) does not pull in every enrichment module and its
+# dependencies.
+_LAZY_EXPORTS = {
+    # Spotify Artist Enrichment
+    "IdentifyMissingArtistsCLI": ".enrich_spotify_artists_granular",
+    "FetchArtistBatchCLI": ".enrich_spotify_artists_granular",
+    "WriteArtistDataCLI": ".enrich_spotify_artists_granular",
+    "ExtractArtistGenresCLI": ".enrich_spotify_artists_granular",
+    # Spotify Album Enrichment
+    "IdentifyMissingAlbumsCLI": ".enrich_spotify_albums_granular",
+    "FetchAlbumBatchCLI": ".enrich_spotify_albums_granular",
+    "WriteAlbumDataCLI": ".enrich_spotify_albums_granular",
+    "ExtractAlbumGenresCLI": ".enrich_spotify_albums_granular",
+    # MBZ Artist Enrichment
+    "IdentifyMissingMBZArtistsCLI": ".enrich_mbz_artists_granular",
+    "FetchMBZArtistBatchCLI": ".enrich_mbz_artists_granular",
+    "TrackMBZFailuresCLI": ".enrich_mbz_artists_granular",
+    # Geography Enrichment
+    "EnrichGeographyBaseCLI": ".enrich_geography_base",
+    "IdentifyCitiesNeedingCoordinatesCLI": ".enrich_geography_coordinates_granular",
+    "FetchCoordinateBatchCLI": ".enrich_geography_coordinates_granular",
+    "WriteCoordinateDataCLI": ".enrich_geography_coordinates_granular",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "base",
@@ -9,6 +9,42 @@ from typing import Dict, Any, Optional, List
 from pathlib import Path
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Result statuses that map to a zero exit code
+_SUCCESS_STATUSES = frozenset({"success", "no_updates"})
+
+
+def dump_result(result: Dict[str, Any]) -> str:
+    """
+    Serialize a result dictionary as indented JSON.
+
+    Uses orjson when it is installed and falls back to the standard library
+    json module otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(result, indent=2)
+
+
+def load_json_file(path: str) -> Any:
+    """
+    Load a JSON document handed over by n8n (e.g. a --data-file payload).
+
+    Uses orjson when it is installed and falls back to the standard library
+    json module otherwise.
+    """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
+        return json.load(f)
+
 
 class CLICommandException(Exception):
     """Exception raised when a CLI command fails, including the result object."""
@@ -24,7 +60,7 @@ class CLICommandException(Exception):
         self.result = result
         self.message = message
         # Format the exception message to include the full result
-        full_message = f"{message}\nResult: {json.dumps(result, indent=2)}"
+        full_message = f"{message}\nResult: {dump_result(result)}"
         super().__init__(full_message)
 
 
@@ -45,6 +81,10 @@ class LogCapturingHandler(logging.Handler):
         except Exception:
             self.handleError(record)
 
+    def reset(self):
+        """Start a fresh capture; results already built keep their own list."""
+        self.records = []
+
 
 # Create formatter
 log_formatter = logging.Formatter(
@@ -59,7 +99,8 @@ _global_log_handler.setFormatter(log_formatter)
 # Attach handler to root logger
 root_logger = logging.getLogger()
 root_logger.addHandler(_global_log_handler)
-root_logger.setLevel(logging.DEBUG)  # Root logger captures all levels
+# Match the capturing handler so DEBUG records are dropped before they are built
+root_logger.setLevel(logging.INFO)
 
 # Configure logging
 logging.basicConfig(
@@ -90,6 +131,9 @@ class CLICommand(ABC):
         self.retries = retries
         self.logger = logging.getLogger(f"cli.{name}")
         self.log_handler = _global_log_handler
+        # n8n builds a new command per Code node in a long-lived runner, so
+        # scope captured logs to this command instead of the whole process
+        self.log_handler.reset()
 
     @abstractmethod
     def execute(self, **kwargs) -> Dict[str, Any]:
@@ -108,6 +152,7 @@ class CLICommand(ABC):
         Returns:
             Exit code (0 for success, 1 for failure)
         """
+        logger = self.logger
         attempt = 0
         max_attempts = self.retries + 1
         last_error = None
@@ -116,34 +161,18 @@ class CLICommand(ABC):
             try:
                 attempt += 1
                 if attempt > 1:
-                    self.logger.info(
+                    logger.info(
                         f"Retry attempt {attempt}/{max_attempts} after {60}s delay"
                     )
                     time.sleep(60)
 
-                self.logger.info(
-                    f"Starting {self.name} (attempt {attempt}/{max_attempts})"
-                )
+                logger.info(f"Starting {self.name} (attempt {attempt}/{max_attempts})")
 
+                started = time.monotonic()
                 result = self._execute_with_timeout(**kwargs)
 
-                self.logger.info(
-                    f"Command completed with status: {result.get('status')}"
-                )
-
-                # Add captured logs to result
-                result["logs"] = self.log_handler.records
-
-                # Output JSON result to stdout
-                print(json.dumps(result, indent=2))
-
-                # Handle successful statuses without raising
-                if result.get("status") in ("success", "no_updates"):
-                    return 0
-
-                # Failure status - raise exception with result
-                raise CLICommandException(
-                    f"Command failed with status: {result.get('status')}", result
+                return self._finalize_run(
+                    result, logger, attempt, max_attempts, time.monotonic() - started
                 )
 
             except CLICommandException:
@@ -151,24 +180,64 @@ class CLICommand(ABC):
                 raise
             except Exception as e:
                 last_error = e
-                self.logger.error(f"Error on attempt {attempt}: {str(e)}")
+                logger.error(f"Error on attempt {attempt}: {str(e)}")
 
                 if attempt >= max_attempts:
                     # All retries exhausted
-                    error_result = {
-                        "status": "error",
-                        "message": f"Command failed after {max_attempts} attempt(s)",
-                        "errors": [str(last_error)],
-                        "data": None,
-                        "logs": self.log_handler.records,
-                    }
-                    print(json.dumps(error_result, indent=2))
-                    raise CLICommandException(
-                        f"Command failed after {max_attempts} attempt(s)", error_result
-                    )
+                    message = f"Command failed after {max_attempts} attempt(s)"
+                    error_result = self.error_result(message, [str(last_error)])
+                    print(dump_result(error_result))
+                    raise CLICommandException(message, error_result)
 
         return 1
 
+    def _finalize_run(
+        self,
+        result: Dict[str, Any],
+        logger: logging.Logger,
+        attempt: int,
+        max_attempts: int,
+        duration: float,
+    ) -> int:
+        """
+        Attach captured logs, emit the JSON result and map status to exit code.
+
+        Args:
+            result: Result dictionary returned by execute()
+            logger: Logger bound by the calling run()
+            attempt: Attempt number that produced the result
+            max_attempts: Total attempts allowed
+            duration: Seconds spent in execute()
+
+        Returns:
+            0 for success/no_updates statuses
+
+        Raises:
+            CLICommandException: If the result status is a failure
+        """
+        status = result.get("status")
+        logger.info(
+            "Command %s completed: status=%s attempt=%d/%d duration=%.1fs",
+            self.name,
+            status,
+            attempt,
+            max_attempts,
+            duration,
+        )
+
+        # Add captured logs to result
+        result["logs"] = self.log_handler.records
+
+        # Output JSON result to stdout
+        print(dump_result(result))
+
+        # Handle successful statuses without raising
+        if status in _SUCCESS_STATUSES:
+            return 0
+
+        # Failure status - raise exception with result
+        raise CLICommandException(f"Command failed with status: {status}", result)
+
     def _execute_with_timeout(self, **kwargs) -> Dict[str, Any]:
         """
         Execute command with timeout enforcement.
@@ -176,12 +245,12 @@ class CLICommand(ABC):
         Note: Python doesn't have true thread-level timeouts, so this is
         advisory. Tasks should check the timeout and exit gracefully.
         """
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             result = self.execute(**kwargs)
 
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             if elapsed > self.timeout:
                 self.logger.warning(
                     f"Timeout exceeded: {elapsed:.1f}s > {self.timeout}s"
@@ -7,13 +7,13 @@ Usage: python flows/cli/consolidate_tracks.py
 """
 
 import sys
-import argparse
 from pathlib import Path
 from typing import Dict, Any
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.cli.base import CLICommand
 
@@ -63,6 +63,8 @@ class ConsolidateTracksCLI(CLICommand):
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Consolidate raw track data into CSV")
 
     args = parser.parse_args()
@@ -21,7 +21,8 @@ from typing import Dict, List, Any
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.cli.n8n_client import N8NClient
 
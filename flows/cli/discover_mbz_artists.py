@@ -12,7 +12,8 @@ from typing import Dict, Any
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.cli.base import CLICommand
 from flows.enrich.musicbrainz_processor import MusicBrainzProcessor
@@ -34,7 +35,7 @@ class DiscoverMBZArtistsCLI(CLICommand):
         Execute artist discovery for MusicBrainz enrichment.
 
         Returns:
-            Result dictionary with list of artists needing enrichment
+            Result dictionary with the number of artists needing enrichment
         """
         try:
             self.logger.info("Starting MusicBrainz artist discovery")
@@ -42,9 +43,11 @@ class DiscoverMBZArtistsCLI(CLICommand):
             result = self.processor.discover_missing_artists()
 
             if result.get("status") == "success":
+                # The fetch step re-queries its own batches, so return the
+                # count rather than the missing-artist DataFrame itself
                 return self.success_result(
                     message=f"Found {result.get('artists_found', 0)} artists needing enrichment",
-                    data=result,
+                    data={"artists_found": result.get("artists_found", 0)},
                 )
             else:
                 return self.no_updates_result(
@@ -14,7 +14,8 @@ from typing import Dict, Any
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.cli.base import CLICommand
 from flows.enrich.geo_processor import GeographicProcessor
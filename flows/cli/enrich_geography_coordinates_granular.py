@@ -18,7 +18,8 @@ import math
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.cli.base import CLICommand
 from flows.enrich.utils.duckdb_queries import DuckDBQueryEngine
@@ -163,7 +164,8 @@ class FetchCoordinateBatchCLI(CLICommand):
             )
 
             if result.get("status") == "success":
-                coordinate_count = len(result.get("coordinate_data", []))
+                coordinate_data = result.get("coordinate_data", [])
+                coordinate_count = len(coordinate_data)
                 self.logger.info(
                     f"Batch {batch_index} complete: {coordinate_count} coordinates fetched"
                 )
@@ -173,7 +175,7 @@ class FetchCoordinateBatchCLI(CLICommand):
                     data={
                         "batch_index": batch_index,
                         "coordinate_count": coordinate_count,
-                        "coordinate_data": result.get("coordinate_data", []),
+                        "coordinate_data": coordinate_data,
                     },
                 )
             else:
@@ -17,7 +17,8 @@ import math
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.cli.base import CLICommand
 from flows.enrich.utils.duckdb_queries import DuckDBQueryEngine
@@ -170,7 +171,9 @@ class FetchMBZArtistBatchCLI(CLICommand):
                     artist_name = row["artist"]
                     isrc = row.get("track_isrc")
 
-                    self.logger.debug(f"Processing artist: {artist_name} ({artist_id})")
+                    self.logger.debug(
+                        "Processing artist: %s (%s)", artist_name, artist_id
+                    )
 
                     # Attempt MBZ lookup using ISRC
                     result = self.processor.fetch_artist_by_isrc(
@@ -180,7 +183,7 @@ class FetchMBZArtistBatchCLI(CLICommand):
                     if result.get("status") == "success":
                         fetched += 1
                         self.logger.debug(
-                            f"Successfully fetched MBZ data for {artist_name}"
+                            "Successfully fetched MBZ data for %s", artist_name
                         )
                     else:
                         failed_artists.append(
@@ -192,7 +195,9 @@ class FetchMBZArtistBatchCLI(CLICommand):
                             }
                         )
                         self.logger.debug(
-                            f"Failed to fetch MBZ data for {artist_name}: {result.get('message')}"
+                            "Failed to fetch MBZ data for %s: %s",
+                            artist_name,
+                            result.get("message"),
                         )
 
                 except Exception as e:
@@ -6,23 +6,17 @@ Similar to artist enrichment but for albums.
 """
 
 import sys
-import argparse
-import json
-from pathlib import Path
+from datetime import datetime, timezone
 from typing import Dict, Any, List
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
-from flows.cli.base import CLICommand
+from flows.cli.base import CLICommand, load_json_file
 from flows.enrich.utils.duckdb_queries import DuckDBQueryEngine
 from flows.enrich.utils.data_writer import ParquetDataWriter
 from flows.enrich.utils.api_clients import SpotifyAPIClient
-from dotenv import load_dotenv
+from flows.enrich.utils.env import load_env
 import polars as pl
 
-load_dotenv()
+load_env()
 
 
 class IdentifyMissingAlbumsCLI(CLICommand):
@@ -199,10 +193,10 @@ class WriteAlbumDataCLI(CLICommand):
             self.logger.info(f"Writing {len(album_data)} albums to parquet")
 
             # Process album data into structured format
+            # One write timestamp for the whole batch
+            last_modified = datetime.now(timezone.utc)
             processed_albums = []
             for album in album_data:
-                from datetime import datetime, timezone
-
                 # Extract primary artist information
                 artists = album.get("artists") or []
                 primary_artist = artists[0] if artists else {}
@@ -220,7 +214,7 @@ class WriteAlbumDataCLI(CLICommand):
                     "release_date": album.get("release_date"),
                     "release_date_precision": album.get("release_date_precision"),
                     "total_tracks": album.get("total_tracks"),
-                    "last_modified": datetime.now(timezone.utc),
+                    "last_modified": last_modified,
                 }
                 processed_albums.append(processed_album)
 
@@ -328,6 +322,8 @@ class ExtractAlbumGenresCLI(CLICommand):
 
 # Main entry points
 def identify_missing_albums_main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Identify missing Spotify albums")
     parser.add_argument(
         "--limit", type=int, default=None, help="Maximum albums to process"
@@ -341,6 +337,8 @@ def identify_missing_albums_main():
 
 
 def fetch_album_batch_main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Fetch album batch from Spotify")
     parser.add_argument("--batch-index", type=int, default=0, help="Batch index")
     parser.add_argument("--batch-size", type=int, default=20, help="Batch size")
@@ -357,12 +355,13 @@ def fetch_album_batch_main():
 
 
 def write_album_data_main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Write album data to parquet")
     parser.add_argument("--data-file", required=True, help="JSON file with album data")
     args = parser.parse_args()
 
-    with open(args.data_file, "r") as f:
-        album_data = json.load(f)
+    album_data = load_json_file(args.data_file)
 
     cli = WriteAlbumDataCLI()
     exit_code = cli.run(album_data=album_data)
@@ -370,12 +369,13 @@ def write_album_data_main():
 
 
 def extract_album_genres_main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Extract album genre data")
     parser.add_argument("--data-file", required=True, help="JSON file with album data")
     args = parser.parse_args()
 
-    with open(args.data_file, "r") as f:
-        album_data = json.load(f)
+    album_data = load_json_file(args.data_file)
 
     cli = ExtractAlbumGenresCLI()
     exit_code = cli.run(album_data=album_data)
@@ -12,23 +12,16 @@ This design is optimized for n8n workflows with better memory management.
 """
 
 import sys
-import argparse
-import json
-from pathlib import Path
 from typing import Dict, Any, List
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
-from flows.cli.base import CLICommand
+from flows.cli.base import CLICommand, load_json_file
 from flows.enrich.utils.duckdb_queries import DuckDBQueryEngine
 from flows.enrich.utils.data_writer import ParquetDataWriter
 from flows.enrich.utils.api_clients import SpotifyAPIClient
-from dotenv import load_dotenv
+from flows.enrich.utils.env import load_env
 import polars as pl
 
-load_dotenv()
+load_env()
 
 
 class IdentifyMissingArtistsCLI(CLICommand):
@@ -217,9 +210,8 @@ class WriteArtistDataCLI(CLICommand):
                 "popularity": "artist_popularity",
             }
 
-            for old_col, new_col in column_mapping.items():
-                if old_col in artist_df.columns and old_col != new_col:
-                    artist_df = artist_df.rename({old_col: new_col})
+            # One rename for every mapped column present in the response
+            artist_df = artist_df.rename(column_mapping, strict=False)
 
             # Select only the expected columns
             expected_columns = [
@@ -298,11 +290,10 @@ class ExtractArtistGenresCLI(CLICommand):
             if "genres" not in artist_df.columns:
                 return self.no_updates_result("No genre data in artist response")
 
-            # Rename id column if needed
-            if "id" in artist_df.columns:
-                artist_df = artist_df.rename({"id": "artist_id"})
-            if "name" in artist_df.columns:
-                artist_df = artist_df.rename({"name": "artist_name"})
+            # Rename id and name columns if present
+            artist_df = artist_df.rename(
+                {"id": "artist_id", "name": "artist_name"}, strict=False
+            )
 
             # Select relevant columns and explode genres
             genre_base = artist_df.select(["artist_id", "artist_name", "genres"])
@@ -350,6 +341,8 @@ class ExtractArtistGenresCLI(CLICommand):
 
 # Main entry points for each command
 def identify_missing_artists_main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Identify missing Spotify artists")
     parser.add_argument(
         "--limit", type=int, default=None, help="Maximum artists to process"
@@ -363,6 +356,8 @@ def identify_missing_artists_main():
 
 
 def fetch_artist_batch_main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Fetch artist batch from Spotify")
     parser.add_argument("--batch-index", type=int, default=0, help="Batch index")
     parser.add_argument("--batch-size", type=int, default=50, help="Batch size")
@@ -379,12 +374,13 @@ def fetch_artist_batch_main():
 
 
 def write_artist_data_main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Write artist data to parquet")
     parser.add_argument("--data-file", required=True, help="JSON file with artist data")
     args = parser.parse_args()
 
-    with open(args.data_file, "r") as f:
-        artist_data = json.load(f)
+    artist_data = load_json_file(args.data_file)
 
     cli = WriteArtistDataCLI()
     exit_code = cli.run(artist_data=artist_data)
@@ -392,12 +388,13 @@ def write_artist_data_main():
 
 
 def extract_artist_genres_main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Extract artist genre data")
     parser.add_argument("--data-file", required=True, help="JSON file with artist data")
     args = parser.parse_args()
 
-    with open(args.data_file, "r") as f:
-        artist_data = json.load(f)
+    artist_data = load_json_file(args.data_file)
 
     cli = ExtractArtistGenresCLI()
     exit_code = cli.run(artist_data=artist_data)
@@ -7,13 +7,13 @@ Usage: python flows/cli/fetch_mbz_artists.py --limit 100 --workers 5
 """
 
 import sys
-import argparse
 from pathlib import Path
 from typing import Dict, Any
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.cli.base import CLICommand
 from flows.enrich.musicbrainz_processor import MusicBrainzProcessor
@@ -78,6 +78,8 @@ class FetchMBZArtistsCLI(CLICommand):
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Fetch MusicBrainz artist data")
     parser.add_argument(
         "--limit",
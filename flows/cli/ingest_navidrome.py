@@ -7,13 +7,13 @@ Usage: python flows/cli/ingest_navidrome.py
 """
 
 import sys
-import argparse
 from pathlib import Path
 from typing import Dict, Any
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.cli.base import CLICommand
 from flows.ingest.navidrome_api_ingestion import NavidromeDataIngestion
@@ -42,12 +42,13 @@ class NavidromeIngestionCLI(CLICommand):
 
             result = self.ingestion.run_ingestion()
 
-            if result.get("status") == "success":
+            status = result.get("status")
+            if status == "success":
                 return self.success_result(
                     message=f"Ingested {result.get('records_ingested', 0)} tracks",
                     data=result,
                 )
-            elif result.get("status") == "no_data":
+            elif status == "no_data":
                 return self.success_result(
                     message="No new data to ingest",
                     data=result,
@@ -67,6 +68,8 @@ class NavidromeIngestionCLI(CLICommand):
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Ingest recently played tracks from Navidrome via ListenBrainz"
     )
@@ -7,13 +7,13 @@ Usage: python flows/cli/ingest_spotify.py --limit 50
 """
 
 import sys
-import argparse
 from pathlib import Path
 from typing import Dict, Any
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.cli.base import CLICommand
 from flows.ingest.spotify_api_ingestion import SpotifyDataIngestion
@@ -40,7 +40,9 @@ class SpotifyIngestionCLI(CLICommand):
         try:
             self.logger.info(f"Starting Spotify ingestion")
 
-            result = self.ingestion.run_ingestion()
+            # The Track Ingestion workflow consolidates once after both
+            # sources have been ingested, so don't rebuild the CSV here too
+            result = self.ingestion.run_ingestion(consolidate=False)
 
             if result.get("status") == "success":
                 return self.success_result(
@@ -62,6 +64,8 @@ class SpotifyIngestionCLI(CLICommand):
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Ingest recently played tracks from Spotify"
     )
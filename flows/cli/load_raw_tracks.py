@@ -12,7 +12,8 @@ from typing import Dict, Any
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.cli.base import CLICommand
 from flows.load.append_tracks import main as append_tracks_main
@@ -38,11 +39,12 @@ class LoadRawTracksCLI(CLICommand):
         try:
             self.logger.info("Starting raw tracks data loading")
 
-            # Call existing append_tracks logic
-            append_tracks_main()
+            # Call existing append_tracks logic in-process
+            metrics = append_tracks_main()
 
             return self.success_result(
-                message="Raw tracks data loaded successfully",
+                message=f"Loaded {metrics['records_loaded']} raw track records",
+                data=metrics,
             )
 
         except Exception as e:
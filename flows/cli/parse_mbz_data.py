@@ -12,7 +12,8 @@ from typing import Dict, Any
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.cli.base import CLICommand
 from flows.enrich.musicbrainz_processor import MusicBrainzProcessor
@@ -41,12 +42,13 @@ class ParseMBZDataCLI(CLICommand):
 
             result = self.processor.parse_artist_json_files()
 
-            if result.get("status") == "success":
+            status = result.get("status")
+            if status == "success":
                 return self.success_result(
                     message=f"Parsed {result.get('artists_processed', 0)} MusicBrainz artist records",
                     data=result,
                 )
-            elif result.get("status") == "no_updates":
+            elif status == "no_updates":
                 return self.no_updates_result(result.get("message", "No data to parse"))
             else:
                 return self.error_result(
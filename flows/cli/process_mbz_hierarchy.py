@@ -12,7 +12,8 @@ from typing import Dict, Any
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.cli.base import CLICommand
 from flows.enrich.musicbrainz_processor import MusicBrainzProcessor
@@ -41,12 +42,13 @@ class ProcessMBZHierarchyCLI(CLICommand):
 
             result = self.processor.process_area_hierarchy()
 
-            if result.get("status") == "success":
+            status = result.get("status")
+            if status == "success":
                 return self.success_result(
                     message=f"Processed {result.get('areas_processed', 0)} geographic areas",
                     data=result,
                 )
-            elif result.get("status") == "no_updates":
+            elif status == "no_updates":
                 return self.no_updates_result(
                     result.get("message", "No areas to process")
                 )
@@ -11,18 +11,123 @@ Usage: python flows/cli/run_dbt.py --select models/reporting
 """
 
 import sys
-import argparse
+import atexit
+import hashlib
+import signal
 import subprocess
 import shutil
+import shlex
+import threading
+import time
 import os
+import re
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.cli.base import CLICommand
+from flows.enrich.utils.paths import get_workspace_dir
+
+# Use absolute path for task-runner compatibility; resolved once at import
+DBT_DIR = get_workspace_dir() / "dbt"
+
+# Common dbt installation locations checked when dbt is not on PATH
+DBT_INSTALL_PATHS = (
+    Path("/usr/local/bin/dbt"),
+    Path("/opt/runners/task-runner-python/.venv/bin/dbt"),
+    Path("/usr/bin/dbt"),
+)
+
+# Marker in dbt_packages/ holding the hash of the package definitions installed
+DEPS_HASH_FILE = ".deps-hash"
+
+# dbt's closing summary, e.g. "Done. PASS=12 WARN=0 ERROR=0 SKIP=0 NO-OP=0 TOTAL=12"
+_SUMMARY_PATTERN = re.compile(r"Done\. (.*TOTAL=\d+)")
+_SUMMARY_COUNT_PATTERN = re.compile(r"([A-Z-]+)=(\d+)")
+
+# Number of trailing output lines kept in results when no errors are found
+OUTPUT_TAIL_LINES = 20
+
+# dbt child processes still running, terminated if the interpreter exits
+_active_processes = set()
+
+
+@lru_cache(maxsize=1)
+def _resolve_dbt_executable() -> Optional[str]:
+    """
+    Locate the dbt executable once per process.
+
+    Returns:
+        Absolute path to dbt from PATH or a common install location, or None
+    """
+    dbt_cmd = shutil.which("dbt")
+    if dbt_cmd:
+        return dbt_cmd
+    for dbt_path in DBT_INSTALL_PATHS:
+        if dbt_path.exists():
+            return str(dbt_path)
+    return None
+
+
+def _terminate_process_group(process, grace_period: float = 5.0):
+    """Send SIGTERM to a child's process group, then SIGKILL if it lingers."""
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+        try:
+            process.wait(timeout=grace_period)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+@atexit.register
+def _terminate_active_processes():
+    for process in list(_active_processes):
+        _terminate_process_group(process)
+
+
+class _OutputCollector:
+    """
+    Keep only the parts of dbt output that end up in the result.
+
+    Every line is already logged as it streams (and dbt writes its own
+    logs/dbt.log), so holding the full output again would grow memory with
+    the size of the run.
+    """
+
+    def __init__(self):
+        self.tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        self.errors = []
+        self.summary = {}
+
+    def append(self, line: str) -> None:
+        self.tail.append(line)
+        if "ERROR" in line or "Error" in line:
+            self.errors.append(line)
+        if "TOTAL=" in line:
+            match = _SUMMARY_PATTERN.search(line)
+            if match:
+                self.summary = {
+                    key.lower().replace("-", "_"): int(value)
+                    for key, value in _SUMMARY_COUNT_PATTERN.findall(match.group(1))
+                }
+
+
+def _summarize_output(output: _OutputCollector) -> Dict[str, Any]:
+    """Reduce dbt output to its result counts and a short tail."""
+    return {"summary": output.summary, "output_tail": list(output.tail)}
+
+
+def _error_lines(output: _OutputCollector) -> List[str]:
+    """Pick dbt's error lines out of its output, falling back to the tail."""
+    return output.errors or list(output.tail)
 
 
 class RunDBTCLI(CLICommand):
@@ -34,11 +139,7 @@ class RunDBTCLI(CLICommand):
             timeout=2400,  # 40 minutes
             retries=2,
         )
-        # Use absolute path for task-runner compatibility
-        workspace_dir = Path("/home/runner/workspace")
-        if not workspace_dir.exists():
-            workspace_dir = Path.cwd()
-        self.dbt_dir = workspace_dir / "dbt"
+        self.dbt_dir = DBT_DIR
 
     def execute(
         self,
@@ -47,6 +148,7 @@ class RunDBTCLI(CLICommand):
         full_refresh: bool = False,
         command: str = "build",
         target: str = None,
+        force_deps: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """
@@ -61,6 +163,7 @@ class RunDBTCLI(CLICommand):
             full_refresh: Force full refresh of all models
             command: dbt command to run ('build' or 'run', default: 'build')
             target: dbt target to use (optional, e.g., 'dev', 'prod')
+            force_deps: Run dbt deps even if packages are already installed
 
         Returns:
             Result dictionary with status and metrics
@@ -80,65 +183,50 @@ class RunDBTCLI(CLICommand):
                 )
 
             # Determine how to invoke dbt
-            # First check if dbt is in PATH
-            dbt_cmd = shutil.which("dbt")
-            if not dbt_cmd:
-                # Check common installation locations
-                common_paths = [
-                    Path("/usr/local/bin/dbt"),
-                    Path("/opt/runners/task-runner-python/.venv/bin/dbt"),
-                    Path("/usr/bin/dbt"),
-                ]
-
-                found = False
-                for dbt_path in common_paths:
-                    if dbt_path.exists():
-                        dbt_cmd = str(dbt_path)
-                        self.logger.info(f"Found dbt at: {dbt_cmd}")
-                        found = True
-                        break
-
-                if not found:
-                    # Last resort: try to import and run as Python module
-                    try:
-                        import dbt
-
-                        dbt_cmd = "dbt"  # Will work via 'python -m dbt'
-                        self.logger.info("dbt found as Python module")
-                    except ImportError:
-                        raise FileNotFoundError(
-                            "dbt executable not found in PATH, /usr/local/bin, /opt/runners/task-runner-python/.venv/bin/, "
-                            "or as a Python module. Please ensure dbt-core is installed."
-                        )
-
-            # Build dbt command as a shell string for simpler execution
-            # Use 'python -m dbt' as fallback if dbt executable isn't found
-            if dbt_cmd and dbt_cmd != "dbt":
-                shell_cmd = f"{dbt_cmd} clean && {dbt_cmd} deps"
-            else:
-                # Use python module syntax which works regardless of installation method
-                shell_cmd = f"python -m dbt clean && python -m dbt deps"
-
-            # For 'run' command, need to seed first; 'build' does it automatically
-            if command == "run":
-                if dbt_cmd and dbt_cmd != "dbt":
-                    shell_cmd += f" && {dbt_cmd} seed && {dbt_cmd} run"
-                else:
-                    shell_cmd += " && python -m dbt seed && python -m dbt run"
-            else:
-                if dbt_cmd and dbt_cmd != "dbt":
-                    shell_cmd += f" && {dbt_cmd} {command}"
-                else:
-                    shell_cmd += f" && python -m dbt {command}"
+            dbt_cmd = _resolve_dbt_executable()
+            if dbt_cmd:
+                self.logger.info(f"Using dbt at: {dbt_cmd}")
 
+            # dbt invocations to run in order, as argument lists
+            selection_args = []
             if select:
-                shell_cmd += f" --select {select}"
+                selection_args += ["--select", select]
             if exclude:
-                shell_cmd += f" --exclude {exclude}"
+                selection_args += ["--exclude", exclude]
             if full_refresh:
-                shell_cmd += " --full-refresh"
+                selection_args.append("--full-refresh")
             if target:
-                shell_cmd += f" --target {target}"
+                selection_args += ["--target", target]
+
+            # dbt deps re-resolves packages over the network; skip it when the
+            # installed packages match the current package definitions
+            deps_hash = self._packages_hash()
+            steps = [["clean"]]
+            if force_deps or not self._deps_up_to_date(deps_hash):
+                steps.append(["deps"])
+            else:
+                self.logger.info("dbt packages up to date, skipping dbt deps")
+            # For 'run' command, need to seed first; 'build' does it automatically
+            if command == "run":
+                steps += [["seed"], ["run"] + selection_args]
+            else:
+                steps.append([command] + selection_args)
+
+            if dbt_cmd:
+                dbt_argv = [dbt_cmd]
+            else:
+                # Last resort: run dbt as a module of this interpreter. It stays
+                # a child process so the timeout can still kill a hung step
+                try:
+                    import dbt  # noqa: F401
+                except ImportError:
+                    raise FileNotFoundError(
+                        "dbt executable not found in PATH, /usr/local/bin, /opt/runners/task-runner-python/.venv/bin/, "
+                        "or as a Python module. Please ensure dbt-core is installed."
+                    )
+
+                self.logger.info("dbt found as Python module")
+                dbt_argv = [sys.executable, "-m", "dbt"]
 
             # Prepare environment for subprocess, ensuring HOME is set for DuckDB
             env = os.environ.copy()
@@ -149,38 +237,30 @@ class RunDBTCLI(CLICommand):
             env["PYTHONUNBUFFERED"] = "1"
             env["OMP_NUM_THREADS"] = "1"  # Limit OpenMP threads for DuckDB
 
-            self.logger.info(f"Running shell command: {shell_cmd}")
-
-            # Execute dbt command via shell for simpler environment handling
-            result = subprocess.run(
-                shell_cmd,
-                shell=True,
-                cwd=str(self.dbt_dir),
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                env=env,
-            )
-
-            # Parse dbt output for metrics
-            output = result.stdout + result.stderr
+            # Run each step directly (no intermediate shell), stopping at the
+            # first failure; the timeout budget covers the whole sequence
+            deadline = time.monotonic() + self.timeout
+            output = _OutputCollector()
             self.logger.info("dbt output:")
-            for line in output.split("\n"):
-                if line.strip():
-                    self.logger.info(line)
-
-            if result.returncode == 0:
+            for step in steps:
+                returncode = self._run_step(dbt_argv + step, env, output, deadline)
+                if returncode != 0:
+                    break
+                if step[0] == "deps":
+                    self._record_deps_hash(deps_hash)
+
+            if returncode == 0:
                 return self.success_result(
                     message="dbt transformations completed successfully",
                     data={
-                        "returncode": result.returncode,
-                        "output": result.stdout,
+                        "returncode": returncode,
+                        **_summarize_output(output),
                     },
                 )
             else:
                 return self.error_result(
                     message="dbt transformations failed",
-                    errors=result.stdout,
+                    errors=_error_lines(output),
                 )
 
         except subprocess.TimeoutExpired:
@@ -197,8 +277,94 @@ class RunDBTCLI(CLICommand):
                 errors=[str(e)],
             )
 
+    def _packages_hash(self) -> str:
+        """Hash packages.yml and package-lock.yml to detect dependency changes."""
+        digest = hashlib.blake2b()
+        for name in ("packages.yml", "package-lock.yml"):
+            path = self.dbt_dir / name
+            if path.exists():
+                digest.update(path.read_bytes())
+        return digest.hexdigest()
+
+    def _deps_up_to_date(self, deps_hash: str) -> bool:
+        """Check whether dbt_packages was installed from the current definitions."""
+        packages_dir = self.dbt_dir / "dbt_packages"
+        marker = packages_dir / DEPS_HASH_FILE
+        if not marker.exists() or marker.read_text() != deps_hash:
+            return False
+        # A stale marker left behind after the packages were removed
+        return any(entry.name != DEPS_HASH_FILE for entry in packages_dir.iterdir())
+
+    def _record_deps_hash(self, deps_hash: str) -> None:
+        """Record the package definitions hash after a successful dbt deps."""
+        packages_dir = self.dbt_dir / "dbt_packages"
+        packages_dir.mkdir(exist_ok=True)
+        (packages_dir / DEPS_HASH_FILE).write_text(deps_hash)
+
+    def _run_step(self, argv, env, output, deadline) -> int:
+        """
+        Run a single dbt invocation, streaming its output into the log.
+
+        Args:
+            argv: Full dbt command line as an argument list
+            env: Environment for the child process
+            output: Collector that keeps the child's tail, errors and summary
+            deadline: time.monotonic() value by which the step must finish
+
+        Returns:
+            The child's return code
+
+        Raises:
+            subprocess.TimeoutExpired: If the step runs past the deadline
+        """
+        self.logger.info(f"Running command: {shlex.join(argv)}")
+
+        # Stream output as it is produced rather than buffering it in memory.
+        # The child leads its own process group so a timeout can take down
+        # anything dbt spawns as well.
+        process = subprocess.Popen(
+            argv,
+            cwd=str(self.dbt_dir),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            env=env,
+            start_new_session=True,
+        )
+        _active_processes.add(process)
+
+        # Readline blocks, so enforce the timeout with a watchdog timer
+        timed_out = threading.Event()
+
+        def kill_on_timeout():
+            timed_out.set()
+            _terminate_process_group(process)
+
+        watchdog = threading.Timer(max(deadline - time.monotonic(), 0), kill_on_timeout)
+        watchdog.start()
+        try:
+            for line in process.stdout:
+                line = line.rstrip("\n")
+                output.append(line)
+                # isspace() tests in place instead of allocating a stripped copy
+                if line and not line.isspace():
+                    self.logger.info(line)
+            returncode = process.wait()
+        finally:
+            watchdog.cancel()
+            _active_processes.discard(process)
+            process.stdout.close()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(argv, self.timeout)
+
+        return returncode
+
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Run dbt transformations")
     parser.add_argument(
         "--select",
@@ -230,6 +396,11 @@ def main():
         default=None,
         help="dbt target to use (optional, e.g., 'dev', 'prod')",
     )
+    parser.add_argument(
+        "--force-deps",
+        action="store_true",
+        help="Run dbt deps even if installed packages are up to date",
+    )
 
     args = parser.parse_args()
 
@@ -240,6 +411,7 @@ def main():
         full_refresh=args.full_refresh,
         command=args.command,
         target=args.target,
+        force_deps=args.force_deps,
     )
     sys.exit(exit_code)
 
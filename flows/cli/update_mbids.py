@@ -12,7 +12,8 @@ from typing import Dict, Any
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.cli.base import CLICommand
 from flows.enrich.spotify_processor import SpotifyProcessor
@@ -41,12 +42,13 @@ class UpdateMBIDsCLI(CLICommand):
 
             result = self.processor.update_artist_mbids()
 
-            if result.get("status") == "success":
+            status = result.get("status")
+            if status == "success":
                 return self.success_result(
                     message="Updated artist MBIDs successfully",
                     data=result,
                 )
-            elif result.get("status") == "no_updates":
+            elif status == "no_updates":
                 return self.no_updates_result(
                     result.get("message", "No MBIDs to update")
                 )
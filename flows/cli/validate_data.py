@@ -12,10 +12,11 @@ from typing import Dict, Any
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.cli.base import CLICommand
-from flows.enrich.utils.data_writer import ParquetDataWriter
+from flows.enrich.utils.paths import get_workspace_dir
 
 
 class ValidateDataCLI(CLICommand):
@@ -27,7 +28,6 @@ class ValidateDataCLI(CLICommand):
             timeout=300,  # 5 minutes
             retries=0,
         )
-        self.data_writer = ParquetDataWriter()
 
     def execute(self, **kwargs) -> Dict[str, Any]:
         """
@@ -40,10 +40,7 @@ class ValidateDataCLI(CLICommand):
             self.logger.info("Starting data validation")
 
             # Use absolute path for task-runner compatibility
-            workspace_dir = Path("/home/runner/workspace")
-            if not workspace_dir.exists():
-                workspace_dir = Path.cwd()
-            base_path = workspace_dir / "data"
+            base_path = get_workspace_dir() / "data"
 
             validation_results = {}
 
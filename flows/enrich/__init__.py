@@ -12,11 +12,35 @@ Modules:
 - utils: Shared utilities (API clients, data writers, Polars operations)
 """
 
-from .geo_processor import GeographicProcessor
-from .musicbrainz_processor import MusicBrainzProcessor
-from .spotify_processor import SpotifyProcessor
-from .utils.data_writer import ParquetDataWriter, EnrichmentTracker
-from .utils.api_clients import SpotifyAPIClient, MusicBrainzClient, OpenWeatherGeoClient
+import importlib
+
+# Exported names and the submodule defining each, imported on first access
+# so that utilities such as utils.paths can be used without loading every
+# processor and its dependencies
+_LAZY_EXPORTS = {
+    "GeographicProcessor": ".geo_processor",
+    "MusicBrainzProcessor": ".musicbrainz_processor",
+    "SpotifyProcessor": ".spotify_processor",
+    "ParquetDataWriter": ".utils.data_writer",
+    "EnrichmentTracker": ".utils.data_writer",
+    "SpotifyAPIClient": ".utils.api_clients",
+    "MusicBrainzClient": ".utils.api_clients",
+    "OpenWeatherGeoClient": ".utils.api_clients",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __version__ = "1.0.0"
 
@@ -18,7 +18,8 @@ import pycountry_convert as pc
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.enrich.utils.api_clients import OpenWeatherGeoClient
 from flows.enrich.utils.data_writer import ParquetDataWriter
@@ -31,6 +32,9 @@ from flows.enrich.utils.polars_ops import (
 
 logger = logging.getLogger(__name__)
 
+# Step statuses that do not degrade the pipeline's overall status
+_OK_STATUSES = frozenset({"success", "no_updates"})
+
 
 class GeographicProcessor:
     """
@@ -377,7 +381,8 @@ class GeographicProcessor:
 
         logger.info(f"Parsed {len(recs)} location parameters")
 
-        # Get coordinates from OpenWeather API
+        # Get coordinates from OpenWeather API, counting hits as we go
+        successful_lookups = 0
         for rec in recs:
             q = rec.get("params")
             if not q:
@@ -387,6 +392,7 @@ class GeographicProcessor:
             if coords:
                 rec["lat"] = str(coords.get("lat"))
                 rec["long"] = str(coords.get("long"))
+                successful_lookups += 1
 
         enriched_records = recs
 
@@ -398,10 +404,6 @@ class GeographicProcessor:
                 cities_update_df, "cities_with_lat_long", mode="append"
             )
 
-            successful_lookups = sum(
-                1 for r in enriched_records if r["lat"] is not None
-            )
-
             logger.info(
                 f"Successfully added coordinates for {successful_lookups}/{len(enriched_records)} locations"
             )
@@ -442,7 +444,7 @@ class GeographicProcessor:
                 f"Continent enrichment result: {continent_result.get('status', 'unknown')}"
             )
 
-            if continent_result["status"] not in ["success", "no_updates"]:
+            if continent_result["status"] not in _OK_STATUSES:
                 results["overall_status"] = "partial_failure"
                 logger.warning(
                     f"Continent enrichment failed with status: {continent_result.get('status')}"
@@ -456,7 +458,7 @@ class GeographicProcessor:
                 f"Parameter addition result: {params_result.get('status', 'unknown')}"
             )
 
-            if params_result["status"] not in ["success", "no_updates"]:
+            if params_result["status"] not in _OK_STATUSES:
                 results["overall_status"] = "partial_failure"
                 logger.warning(
                     f"Parameter addition failed with status: {params_result.get('status')}"
@@ -538,7 +540,8 @@ class GeographicProcessor:
 
         logger.info(f"Parsed {len(recs)} location parameters")
 
-        # Get coordinates from OpenWeather API
+        # Get coordinates from OpenWeather API, counting hits as we go
+        successful_lookups = 0
         for rec in recs:
             q = rec.get("params")
             if not q:
@@ -548,13 +551,10 @@ class GeographicProcessor:
             if coords:
                 rec["lat"] = str(coords.get("lat"))
                 rec["long"] = str(coords.get("long"))
+                successful_lookups += 1
 
         enriched_records = recs
 
-        successful_lookups = sum(
-            1 for r in enriched_records if "lat" in r and r.get("lat") is not None
-        )
-
         logger.info(
             f"Successfully looked up coordinates for {successful_lookups}/{len(enriched_records)} locations"
         )
@@ -591,7 +591,7 @@ class GeographicProcessor:
                 f"Continent enrichment result: {continent_result.get('status', 'unknown')}"
             )
 
-            if continent_result["status"] not in ["success", "no_updates"]:
+            if continent_result["status"] not in _OK_STATUSES:
                 results["overall_status"] = "partial_failure"
                 logger.warning(
                     f"Continent enrichment failed with status: {continent_result.get('status')}"
@@ -605,7 +605,7 @@ class GeographicProcessor:
                 f"Parameter addition result: {params_result.get('status', 'unknown')}"
             )
 
-            if params_result["status"] not in ["success", "no_updates"]:
+            if params_result["status"] not in _OK_STATUSES:
                 results["overall_status"] = "partial_failure"
                 logger.warning(
                     f"Parameter addition failed with status: {params_result.get('status')}"
@@ -619,7 +619,7 @@ class GeographicProcessor:
                 f"Coordinate enrichment result: {coords_result.get('status', 'unknown')}"
             )
 
-            if coords_result["status"] not in ["success", "no_updates"]:
+            if coords_result["status"] not in _OK_STATUSES:
                 results["overall_status"] = "partial_failure"
                 logger.warning(
                     f"Coordinate enrichment failed with status: {coords_result.get('status')}"
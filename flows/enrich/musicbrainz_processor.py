@@ -16,12 +16,19 @@ from typing import Dict, Any, List, Optional, Set
 from pathlib import Path
 import polars as pl
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.enrich.utils.api_clients import MusicBrainzClient
 from flows.enrich.utils.data_writer import ParquetDataWriter, EnrichmentTracker
+from flows.enrich.utils.paths import get_workspace_dir
 from flows.enrich.utils.polars_ops import (
     normalize_artist_json_data,
     process_area_hierarchy_data,
@@ -31,6 +38,52 @@ from flows.enrich.utils.polars_ops import (
 
 logger = logging.getLogger(__name__)
 
+# Step statuses that do not degrade the pipeline's overall status
+_PARSE_OK_STATUSES = frozenset({"success", "no_data"})
+_AREA_OK_STATUSES = frozenset({"success", "no_updates", "no_data"})
+
+
+def _write_artist_json(json_file: Path, artist_data: Dict[str, Any]) -> None:
+    """
+    Write a fetched artist payload to the JSON cache.
+
+    The cache is only read back by parse_artist_json_files, so it is
+    written compactly rather than indented.
+    """
+    if orjson is not None:
+        # musicbrainzngs returns plain dicts/lists/strings, so orjson needs
+        # no default= callback
+        json_file.write_bytes(orjson.dumps(artist_data))
+    else:
+        with open(json_file, "w") as f:
+            json.dump(artist_data, f, separators=(",", ":"), default=str)
+
+
+def _nested_to_json(value: Any) -> Optional[str]:
+    """
+    Serialize a List or Struct cell to a JSON string for the string-typed
+    mbz_artist_info columns.
+
+    map_elements hands List cells over as Series, so they are converted to
+    plain lists first.
+    """
+    if value is None:
+        return None
+    if isinstance(value, pl.Series):
+        value = value.to_list()
+    if orjson is not None:
+        return orjson.dumps(value, default=str).decode()
+    return json.dumps(value, default=str)
+
+
+def _read_artist_json(json_file) -> Dict[str, Any]:
+    """Read a cached artist payload."""
+    if orjson is not None:
+        with open(json_file, "rb") as f:
+            return orjson.loads(f.read())
+    with open(json_file, "r") as f:
+        return json.load(f)
+
 
 class MusicBrainzProcessor:
     """
@@ -51,10 +104,7 @@ class MusicBrainzProcessor:
         if cache_dir:
             self.cache_dir = Path(cache_dir)
         else:
-            workspace_dir = Path("/home/runner/workspace")
-            if not workspace_dir.exists():
-                workspace_dir = Path.cwd()
-            self.cache_dir = workspace_dir / "data" / "cache" / "mbz"
+            self.cache_dir = get_workspace_dir() / "data" / "cache" / "mbz"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def discover_missing_artists(self) -> Dict[str, Any]:
@@ -121,8 +171,7 @@ class MusicBrainzProcessor:
 
                 # Save to JSON file
                 json_file = self.cache_dir / f"{artist_mbid}.json"
-                with open(json_file, "w") as f:
-                    json.dump(artist_data, f, indent=2, default=str)
+                _write_artist_json(json_file, artist_data)
 
                 artists_fetched += 1
 
@@ -174,8 +223,7 @@ class MusicBrainzProcessor:
 
         for json_file in json_files:
             try:
-                with open(json_file, "r") as f:
-                    artist_data = json.load(f)
+                artist_data = _read_artist_json(json_file)
 
                 # Normalize the JSON data
                 normalized_data = normalize_artist_json_data(artist_data)
@@ -199,19 +247,10 @@ class MusicBrainzProcessor:
         if not artist_records:
             return {"status": "error", "message": "No valid artist records processed"}
 
-        # Create DataFrame from all records
-        # Get all unique columns
-        all_columns = set()
-        for record in artist_records:
-            all_columns.update(record.keys())
-
-        # Ensure all records have all columns
-        for record in artist_records:
-            for col in all_columns:
-                if col not in record:
-                    record[col] = None
-
-        artist_df = pl.DataFrame(artist_records)
+        # Create DataFrame from all records. Artists carry different optional
+        # fields, so infer the schema from every record rather than the first
+        # 100; Polars fills the columns a record lacks with nulls
+        artist_df = pl.DataFrame(artist_records, infer_schema_length=None)
 
         # Ensure schema compatibility with existing table
         existing_df = self.data_writer.read_table("mbz_artist_info")
@@ -239,10 +278,7 @@ class MusicBrainzProcessor:
                     # For complex types, convert to JSON string
                     string_columns.append(
                         pl.col(col)
-                        .map_elements(
-                            lambda x: json.dumps(x) if x is not None else None,
-                            return_dtype=pl.Utf8,
-                        )
+                        .map_elements(_nested_to_json, return_dtype=pl.Utf8)
                         .alias(col)
                     )
                 else:
@@ -328,15 +364,22 @@ class MusicBrainzProcessor:
 
         musicbrainzngs.set_useragent("rws-music-enrichment", "1.0")
 
+        # Parent areas (countries, continents) are shared by many areas, so
+        # fetch each one from the API at most once per run
+        area_cache = {}
+
         for i, area_id in enumerate(area_ids):
-            logger.info(f"Processing {i + 1}/{len(area_ids)}: {area_id}")
             try:
-                areas = self._get_area_with_parents(area_id)
+                areas = self._get_area_with_parents(area_id, area_cache)
                 all_areas[area_id] = areas
             except Exception as e:
                 logger.error(f"Error processing area {area_id}: {e}")
                 continue
 
+            # Progress logging
+            if (i + 1) % 10 == 0:
+                logger.info(f"Processed {i + 1}/{len(area_ids)} areas")
+
         if not all_areas:
             return {
                 "status": "no_data",
@@ -362,14 +405,21 @@ class MusicBrainzProcessor:
             "write_result": write_result,
         }
 
-    def _get_area_with_parents(self, area_id: str) -> Dict[str, Any]:
+    def _get_area_with_parents(
+        self, area_id: str, area_cache: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Get area and all its parent areas in a flat structure.
         Based on the working Fabric notebook implementation.
+
+        Args:
+            area_id: MusicBrainz area ID
+            area_cache: Area lookups already made in this run, keyed by ID
         """
         import musicbrainzngs
-        from time import sleep
 
+        if area_cache is None:
+            area_cache = {}
         areas = {}
         visited = set()
 
@@ -379,10 +429,13 @@ class MusicBrainzProcessor:
             visited.add(id)
 
             try:
-                sleep(0.5)  # Rate limiting
-                area_data = musicbrainzngs.get_area_by_id(id, includes=["area-rels"])[
-                    "area"
-                ]
+                area_data = area_cache.get(id)
+                if area_data is None:
+                    # Rate limited by musicbrainzngs (see MusicBrainzClient)
+                    area_data = musicbrainzngs.get_area_by_id(
+                        id, includes=["area-rels"]
+                    )["area"]
+                    area_cache[id] = area_data
 
                 # Store this area
                 area_type = (
@@ -478,30 +531,30 @@ class MusicBrainzProcessor:
             logger.info("No mbz_artist_info table found")
             return []
 
-        logger.info(f"Found {len(artist_df)} artists in mbz_artist_info table")
-
         # Collect all area IDs from artist data
         area_ids = set()
+        column_counts = {}
 
         # Get area IDs from various columns
         for col in ["area_id", "begin_area_id", "end_area_id"]:
             if col in artist_df.columns:
                 ids = artist_df.select(col).drop_nulls().to_series().to_list()
                 area_ids.update(ids)
-                logger.info(f"Found {len(ids)} area IDs in column {col}")
-
-        logger.info(f"Total unique area IDs collected: {len(area_ids)}")
+                column_counts[col] = len(ids)
 
         # Filter out areas that already have hierarchy data
+        existing_count = 0
         if existing_hierarchy_df is not None:
             existing_ids = set(
                 existing_hierarchy_df.select("area_id").to_series().to_list()
             )
-            logger.info(f"Found {len(existing_ids)} existing area hierarchies")
+            existing_count = len(existing_ids)
             area_ids = area_ids - existing_ids
-            logger.info(f"Area IDs needing processing after filtering: {len(area_ids)}")
-        else:
-            logger.info("No existing hierarchy data found")
+
+        logger.info(
+            f"Collected area IDs from {len(artist_df)} artists {column_counts}; "
+            f"{existing_count} existing hierarchies, {len(area_ids)} need processing"
+        )
 
         return sorted(list(area_ids))
 
@@ -551,8 +604,7 @@ class MusicBrainzProcessor:
 
             # Save to JSON file
             json_file = self.cache_dir / f"{artist_mbid}.json"
-            with open(json_file, "w") as f:
-                json.dump(artist_data, f, indent=2, default=str)
+            _write_artist_json(json_file, artist_data)
 
             logger.info(f"Successfully fetched MBZ data for {artist_name}")
             return {
@@ -686,7 +738,7 @@ class MusicBrainzProcessor:
             parse_result = self.parse_artist_json_files()
             results["artist_parsing"] = parse_result
 
-            if parse_result["status"] not in ["success", "no_data"]:
+            if parse_result["status"] not in _PARSE_OK_STATUSES:
                 results["overall_status"] = "partial_failure"
 
             # Step 4: Process area hierarchy
@@ -694,14 +746,10 @@ class MusicBrainzProcessor:
                 area_result = self.process_area_hierarchy(limit=limit)
                 results["area_processing"] = area_result
 
-                if area_result["status"] not in [
-                    "success",
-                    "no_updates",
-                    "no_data",
-                ]:
+                if area_result["status"] not in _AREA_OK_STATUSES:
                     results["overall_status"] = "partial_failure"
             else:
-                results = {"status": "skipped"}
+                results["area_processing"] = {"status": "skipped"}
 
             logger.info("MusicBrainz enrichment pipeline completed")
             return results
@@ -10,26 +10,30 @@ writing directly to parquet files.
 import sys
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 from pathlib import Path
 import polars as pl
 
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.enrich.utils.api_clients import SpotifyAPIClient
 from flows.enrich.utils.data_writer import ParquetDataWriter, EnrichmentTracker
 from flows.enrich.utils.polars_ops import explode_genre_array, batch_process_dataframe
+from flows.enrich.utils.env import load_env
+
+# Load environment variables
+load_env()
 
 logger = logging.getLogger(__name__)
 
+# Step statuses that do not degrade the pipeline's overall status
+_OK_STATUSES = frozenset({"success", "no_updates"})
+
 
 class SpotifyProcessor:
     """
@@ -110,9 +114,8 @@ class SpotifyProcessor:
                 "popularity": "artist_popularity",
             }
 
-            for old_col, new_col in column_mapping.items():
-                if old_col in artist_df.columns and old_col != new_col:
-                    artist_df = artist_df.rename({old_col: new_col})
+            # One rename for every mapped column present in the response
+            artist_df = artist_df.rename(column_mapping, strict=False)
 
             # Select only the expected columns to match existing schema
             expected_columns = [
@@ -191,6 +194,8 @@ class SpotifyProcessor:
                 }
 
             # Process album data into structured format
+            # One write timestamp for the whole batch
+            last_modified = datetime.now(timezone.utc)
             processed_albums = []
             for album in album_data:
                 # Extract primary artist information
@@ -210,7 +215,7 @@ class SpotifyProcessor:
                     "release_date": album.get("release_date"),
                     "release_date_precision": album.get("release_date_precision"),
                     "total_tracks": album.get("total_tracks"),
-                    "last_modified": datetime.now(timezone.utc),
+                    "last_modified": last_modified,
                 }
                 processed_albums.append(processed_album)
 
@@ -334,7 +339,9 @@ class SpotifyProcessor:
         try:
             # Read both tables
             spotify_artists_df = self.data_writer.read_table("spotify_artists")
-            mbz_artist_df = self.data_writer.read_table("mbz_artist_info")
+            mbz_artist_df = self.data_writer.read_table(
+                "mbz_artist_info", columns=["spotify_id", "id"]
+            )
 
             if spotify_artists_df is None or mbz_artist_df is None:
                 return {"status": "error", "message": "Required tables not found"}
@@ -350,39 +357,31 @@ class SpotifyProcessor:
                     "message": "No artists need MBID updates",
                 }
 
-            # Join with MusicBrainz data
-            updated_artists = artists_needing_mbid.join(
-                mbz_artist_df.select(["spotify_id", "id"]).rename(
-                    {"id": "artist_mbid_new"}
-                ),
-                left_on="artist_id",
-                right_on="spotify_id",
-                how="left",
-            )
-
-            # Update MBID where available
-            updated_artists = updated_artists.with_columns(
-                pl.coalesce([pl.col("artist_mbid_new"), pl.col("artist_mbid")]).alias(
-                    "artist_mbid"
+            # Join with MusicBrainz data, keeping only artists that now have an MBID
+            updated_artists = (
+                artists_needing_mbid.join(
+                    mbz_artist_df.rename({"id": "artist_mbid_new"}),
+                    left_on="artist_id",
+                    right_on="spotify_id",
+                    how="inner",
                 )
-            ).drop("artist_mbid_new")
-
-            # Combine with unchanged artists
-            unchanged_artists = spotify_artists_df.filter(
-                pl.col("artist_mbid").is_not_null()
+                .filter(pl.col("artist_mbid_new").is_not_null())
+                .with_columns(pl.col("artist_mbid_new").alias("artist_mbid"))
+                .drop("artist_mbid_new")
             )
 
-            final_artists_df = pl.concat([unchanged_artists, updated_artists])
+            if updated_artists.is_empty():
+                return {
+                    "status": "no_updates",
+                    "message": "No MusicBrainz matches for artists missing an MBID",
+                }
 
-            # Write back to parquet - use merge to preserve existing data
+            # Merge upserts on artist_id, so only the changed rows need writing
             write_result = self.data_writer.write_table(
-                final_artists_df, "spotify_artists", mode="merge"
+                updated_artists, "spotify_artists", mode="merge"
             )
 
-            # Count updates
-            updates_made = updated_artists.filter(
-                pl.col("artist_mbid").is_not_null()
-            ).height
+            updates_made = updated_artists.height
 
             logger.info(f"Updated {updates_made} artist MBIDs")
 
@@ -413,26 +412,33 @@ class SpotifyProcessor:
         }
 
         try:
-            # Step 1: Enrich artist data
-            artist_result = self.enrich_artists(limit=limit)
-            results["artist_enrichment"] = artist_result
+            # Album enrichment reads and writes separate tables from the
+            # artist steps, so run it in the background. The MBID update only
+            # depends on spotify_artists and starts as soon as artist
+            # enrichment is done rather than waiting on the albums too
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                album_future = executor.submit(self.enrich_albums, limit=limit)
+
+                # Step 1: Enrich artists
+                artist_result = self.enrich_artists(limit=limit)
+                results["artist_enrichment"] = artist_result
 
-            if artist_result["status"] not in ["success", "no_updates"]:
-                results["overall_status"] = "partial_failure"
+                if artist_result["status"] not in _OK_STATUSES:
+                    results["overall_status"] = "partial_failure"
 
-            # Step 2: Enrich album data
-            album_result = self.enrich_albums(limit=limit)
-            results["album_enrichment"] = album_result
+                # Step 2: Update artist MBIDs
+                mbid_result = self.update_artist_mbids()
+                results["mbid_updates"] = mbid_result
 
-            if album_result["status"] not in ["success", "no_updates"]:
-                results["overall_status"] = "partial_failure"
+                if mbid_result["status"] not in _OK_STATUSES:
+                    results["overall_status"] = "partial_failure"
 
-            # Step 3: Update artist MBIDs
-            mbid_result = self.update_artist_mbids()
-            results["mbid_updates"] = mbid_result
+                # Step 3: Join the album enrichment
+                album_result = album_future.result()
+                results["album_enrichment"] = album_result
 
-            if mbid_result["status"] not in ["success", "no_updates"]:
-                results["overall_status"] = "partial_failure"
+                if album_result["status"] not in _OK_STATUSES:
+                    results["overall_status"] = "partial_failure"
 
             logger.info("Spotify enrichment pipeline completed")
             return results
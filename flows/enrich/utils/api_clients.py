@@ -18,6 +18,8 @@ from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
+from flows.enrich.utils.paths import get_workspace_dir
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +32,11 @@ class SpotifyAPIClient:
     BASE_URL = "https://api.spotify.com/v1"
     TOKEN_URL = "https://accounts.spotify.com/api/token"
 
+    # Access tokens shared by every client instance in this process, keyed by
+    # (client_id, refresh_token). The n8n task runner keeps the interpreter
+    # alive between Code node runs, so new clients can reuse a live token.
+    _token_cache: Dict[tuple, tuple] = {}
+
     def __init__(
         self,
         client_id: str = None,
@@ -39,8 +46,9 @@ class SpotifyAPIClient:
         self.client_id = client_id or os.getenv("SPOTIFY_CLIENT_ID")
         self.client_secret = client_secret or os.getenv("SPOTIFY_CLIENT_SECRET")
         self.refresh_token = refresh_token or os.getenv("SPOTIFY_REFRESH_TOKEN")
-        self._access_token = None
-        self._token_expires_at = None
+        self._access_token, self._token_expires_at = self._token_cache.get(
+            (self.client_id, self.refresh_token), (None, None)
+        )
 
         if not self.client_id or not self.client_secret or not self.refresh_token:
             raise ValueError("Spotify credentials not found")
@@ -50,12 +58,10 @@ class SpotifyAPIClient:
         now = datetime.now(timezone.utc)
 
         # Check if we have a valid token
-        if (
-            self._access_token
-            and self._token_expires_at
-            and now < self._token_expires_at
-        ):
-            return self._access_token
+        access_token = self._access_token
+        expires_at = self._token_expires_at
+        if access_token and expires_at and now < expires_at:
+            return access_token
 
         # Get new token
         auth_string = f"{self.client_id}:{self.client_secret}"
@@ -79,6 +85,10 @@ class SpotifyAPIClient:
 
             # Set expiration time (with 5 minute buffer)
             self._token_expires_at = now + timedelta(seconds=expires_in - 300)
+            self._token_cache[(self.client_id, self.refresh_token)] = (
+                self._access_token,
+                self._token_expires_at,
+            )
 
             logger.info("Successfully obtained Spotify access token")
             return self._access_token
@@ -88,7 +98,7 @@ class SpotifyAPIClient:
             raise
 
     def _make_request(
-        self, endpoint: str, params: Dict[str, Any] = None
+        self, endpoint: str, params: Dict[str, Any] = None, retry_auth: bool = True
     ) -> Dict[str, Any]:
         """Make authenticated request to Spotify API."""
         token = self._get_access_token()
@@ -97,9 +107,10 @@ class SpotifyAPIClient:
 
         try:
             response = requests.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            logger.debug(f"Spotify API response status: {response.status_code}")
-            return response.json()
+            if response.status_code != 401 or not retry_auth:
+                response.raise_for_status()
+                logger.debug(f"Spotify API response status: {response.status_code}")
+                return response.json()
         except requests.exceptions.RequestException as e:
             logger.error(f"Spotify API request failed: {e}")
             if hasattr(e, "response") and e.response is not None:
@@ -107,6 +118,14 @@ class SpotifyAPIClient:
                 logger.error(f"Response body: {e.response.text}")
             raise
 
+        # The shared token was rejected before its expiry (e.g. revoked);
+        # evict it so this and later clients fetch a new one, then retry once
+        logger.warning("Spotify rejected the access token, refreshing it")
+        self._token_cache.pop((self.client_id, self.refresh_token), None)
+        self._access_token = None
+        self._token_expires_at = None
+        return self._make_request(endpoint, params, retry_auth=False)
+
     def get_recently_played(self, after: str = None) -> Dict[str, Any]:
         """Get recently played tracks."""
         params = {"limit": 50}
@@ -127,6 +146,8 @@ class SpotifyAPIClient:
     ) -> List[Dict[str, Any]]:
         """Get multiple artists in batches with rate limiting."""
         results = []
+        # Request each ID once, keeping the caller's order
+        artist_ids = list(dict.fromkeys(artist_ids))
 
         for i in range(0, len(artist_ids), batch_size):
             batch = artist_ids[i : i + batch_size]
@@ -136,7 +157,9 @@ class SpotifyAPIClient:
                 response = self._make_request("/artists", {"ids": ids_param})
                 results.extend(response.get("artists", []))
 
-                # Rate limiting
+                # Rate limiting, only needed before another batch
+                if i + batch_size >= len(artist_ids):
+                    continue
                 sleep(1)
                 if (i // batch_size + 1) % 10 == 0:
                     logger.info(f"Processed {i + len(batch)} artists")
@@ -153,6 +176,8 @@ class SpotifyAPIClient:
     ) -> List[Dict[str, Any]]:
         """Get multiple albums in batches with rate limiting."""
         results = []
+        # Request each ID once, keeping the caller's order
+        album_ids = list(dict.fromkeys(album_ids))
 
         for i in range(0, len(album_ids), batch_size):
             batch = album_ids[i : i + batch_size]
@@ -162,7 +187,9 @@ class SpotifyAPIClient:
                 response = self._make_request("/albums", {"ids": ids_param})
                 results.extend(response.get("albums", []))
 
-                # Rate limiting
+                # Rate limiting, only needed before another batch
+                if i + batch_size >= len(album_ids):
+                    continue
                 sleep(1)
                 if (i // batch_size + 1) % 5 == 0:
                     logger.info(f"Processed {i + len(batch)} albums")
@@ -185,19 +212,19 @@ class MusicBrainzClient:
         self, user_agent: str = "fffv_tracks_history/0.1", cache_dir: str = None
     ):
         mbz.set_useragent(user_agent, "0.1")
+        # musicbrainzngs spaces requests itself, sleeping only for whatever
+        # remains of the interval since the last call; keep it at the
+        # documented 1 request/second
+        mbz.set_rate_limit(limit_or_interval=1.0, new_requests=1)
         if cache_dir:
             self.cache_dir = Path(cache_dir)
         else:
-            workspace_dir = Path("/home/runner/workspace")
-            if not workspace_dir.exists():
-                workspace_dir = Path.cwd()
-            self.cache_dir = workspace_dir / "data" / "cache" / "mbz"
+            self.cache_dir = get_workspace_dir() / "data" / "cache" / "mbz"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def get_artist_by_isrc(self, isrc: str) -> Optional[str]:
         """Get artist MBID by ISRC code."""
         try:
-            sleep(1)  # Rate limiting
             recording = mbz.get_recordings_by_isrc(isrc, includes=["artists"])
             return recording["isrc"]["recording-list"][0]["artist-credit"][0]["artist"][
                 "id"
@@ -213,7 +240,6 @@ class MusicBrainzClient:
         includes = includes or ["tags", "release-groups", "aliases"]
 
         try:
-            sleep(1)  # Rate limiting
             result = mbz.get_artist_by_id(artist_mbid, includes=includes)
             return result["artist"]
         except Exception as e:
@@ -227,7 +253,6 @@ class MusicBrainzClient:
         includes = includes or ["area-rels"]
 
         try:
-            sleep(0.5)  # Rate limiting
             result = mbz.get_area_by_id(area_id, includes=includes)
             return result["area"]
         except Exception as e:
@@ -12,6 +12,8 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 import polars as pl
 
+from flows.enrich.utils.paths import get_workspace_dir
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,10 +26,7 @@ class ParquetDataWriter:
     def __init__(self, base_path: str = "data/src"):
         # Use absolute path for task-runner compatibility
         if not base_path.startswith("/"):
-            workspace_dir = Path("/home/runner/workspace")
-            if not workspace_dir.exists():
-                workspace_dir = Path.cwd()
-            base_path = str(workspace_dir / base_path)
+            base_path = str(get_workspace_dir() / base_path)
 
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
@@ -75,7 +74,8 @@ class ParquetDataWriter:
         )
 
         logger.info(f"Overwrote {table_name} with {len(df)} records to {output_file}")
-        logger.info(f"DataFrame shape: {df.shape}, columns: {df.columns}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DataFrame shape: %s, columns: %s", df.shape, df.columns)
         return {
             "status": "success",
             "operation": "overwrite",
@@ -305,8 +305,16 @@ class ParquetDataWriter:
         }
         return merge_key_mapping.get(table_name, [])
 
-    def read_table(self, table_name: str) -> Optional[pl.DataFrame]:
-        """Read existing parquet table."""
+    def read_table(
+        self, table_name: str, columns: Optional[List[str]] = None
+    ) -> Optional[pl.DataFrame]:
+        """
+        Read existing parquet table.
+
+        Args:
+            table_name: Name of the table to read
+            columns: Only read these columns (default: all)
+        """
         table_path = self.base_path / table_name
         parquet_files = list(table_path.glob("*.parquet"))
 
@@ -315,7 +323,7 @@ class ParquetDataWriter:
             return None
 
         try:
-            return pl.read_parquet(parquet_files)
+            return pl.read_parquet(parquet_files, columns=columns)
         except Exception as e:
             logger.error(f"Error reading table {table_name}: {e}")
             return None
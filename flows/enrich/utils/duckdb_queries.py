@@ -7,13 +7,46 @@ reducing memory footprint compared to loading full tables into Polars.
 """
 
 import logging
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import duckdb
 import polars as pl
 
+from flows.enrich.utils.paths import get_workspace_dir
+
 logger = logging.getLogger(__name__)
 
+# Tables exposed as views over their parquet files
+PARQUET_TABLES = [
+    "tracks_played",
+    "spotify_artists",
+    "spotify_albums",
+    "mbz_artist_info",
+    "mbz_area_hierarchy",
+    "cities_with_lat_long",
+]
+
+# Guards view creation on the shared connections; DuckDB raises a catalog
+# write-write conflict when two cursors replace the same view concurrently
+_VIEW_LOCK = threading.Lock()
+
+# Views already created on each data directory's connection
+_registered_views: Dict[str, set] = {}
+
+
+@lru_cache(maxsize=None)
+def _get_connection(base_path: str) -> duckdb.DuckDBPyConnection:
+    """
+    Open the in-memory DuckDB database for a data directory once per process.
+
+    Each query runs on its own cursor over this connection, so engines
+    created by successive CLI commands in the warm task runner share one
+    database instead of connecting per query.
+    """
+    return duckdb.connect(":memory:")
+
 
 class DuckDBQueryEngine:
     """
@@ -23,10 +56,7 @@ class DuckDBQueryEngine:
     def __init__(self, base_path: str = "data/src"):
         # Use absolute path for task-runner compatibility
         if not base_path.startswith("/"):
-            workspace_dir = Path("/home/runner/workspace")
-            if not workspace_dir.exists():
-                workspace_dir = Path.cwd()
-            base_path = str(workspace_dir / base_path)
+            base_path = str(get_workspace_dir() / base_path)
 
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
@@ -36,6 +66,29 @@ class DuckDBQueryEngine:
         table_path = self.base_path / table_name
         return str(table_path / "*.parquet")
 
+    def _cursor(self) -> duckdb.DuckDBPyConnection:
+        """
+        Open a cursor on the shared connection, first creating views for any
+        tables whose directories have appeared since the last call.
+
+        Views are created once per connection; the glob is expanded when a
+        query runs, so they stay current as files are added.
+        """
+        base_path = str(self.base_path)
+        with _VIEW_LOCK:
+            conn = _get_connection(base_path)
+            views = _registered_views.setdefault(base_path, set())
+            for table_name in PARQUET_TABLES:
+                if table_name in views:
+                    continue
+                table_path = self._get_table_path(table_name)
+                if Path(table_path.replace("*.parquet", "")).exists():
+                    conn.execute(
+                        f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM read_parquet('{table_path}')"
+                    )
+                    views.add(table_name)
+        return conn.cursor()
+
     def execute_query(
         self, query: str, params: Optional[Dict[str, Any]] = None
     ) -> pl.DataFrame:
@@ -49,36 +102,17 @@ class DuckDBQueryEngine:
         Returns:
             Query results as Polars DataFrame
         """
+        conn = self._cursor()
         try:
-            conn = duckdb.connect(":memory:")
-
-            # Register parquet files as views
-            for table_name in [
-                "tracks_played",
-                "spotify_artists",
-                "spotify_albums",
-                "mbz_artist_info",
-                "mbz_area_hierarchy",
-                "cities_with_lat_long",
-            ]:
-                table_path = self._get_table_path(table_name)
-                if Path(table_path.replace("*.parquet", "")).exists():
-                    conn.execute(
-                        f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM read_parquet('{table_path}')"
-                    )
-
-            # Execute query
             if params:
-                result = conn.execute(query, params).pl()
-            else:
-                result = conn.execute(query).pl()
-
-            conn.close()
-            return result
+                return conn.execute(query, params).pl()
+            return conn.execute(query).pl()
 
         except Exception as e:
             logger.error(f"Error executing query: {e}")
             raise
+        finally:
+            conn.close()
 
     def get_missing_spotify_artists(
         self, limit: Optional[int] = None, offset: int = 0
@@ -343,16 +377,8 @@ class DuckDBQueryEngine:
         # Create a temporary table from the list
         ids_df = pl.DataFrame({"artist_id": artist_ids})
 
+        conn = self._cursor()
         try:
-            conn = duckdb.connect(":memory:")
-
-            # Register tables
-            table_path = self._get_table_path("spotify_artists")
-            if Path(table_path.replace("*.parquet", "")).exists():
-                conn.execute(
-                    f"CREATE OR REPLACE VIEW spotify_artists AS SELECT * FROM read_parquet('{table_path}')"
-                )
-
             # Register the input list
             conn.register("input_ids", ids_df)
 
@@ -366,10 +392,11 @@ class DuckDBQueryEngine:
             """
 
             result = conn.execute(query).pl()
-            conn.close()
 
             return dict(zip(result["artist_id"], result["exists"]))
 
         except Exception as e:
             logger.error(f"Error checking artist existence: {e}")
             return {aid: False for aid in artist_ids}
+        finally:
+            conn.close()
@@ -0,0 +1,24 @@
+"""
+Environment loading shared by processors and CLI commands.
+
+Several modules need the project's .env; loading it through here reads and
+parses the file once per process instead of once per importing module.
+"""
+
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=None)
+def load_env(override: bool = False) -> bool:
+    """
+    Load the project's .env into os.environ once per process.
+
+    Args:
+        override: Replace variables already set in the environment
+
+    Returns:
+        True if a .env file was found and loaded
+    """
+    return load_dotenv(override=override)
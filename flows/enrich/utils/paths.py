@@ -0,0 +1,24 @@
+"""
+Workspace path resolution shared by processors and clients.
+
+The n8n task runner mounts the project at /home/runner/workspace; local runs
+fall back to the current working directory.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+TASK_RUNNER_WORKSPACE = Path("/home/runner/workspace")
+
+
+@lru_cache(maxsize=1)
+def get_workspace_dir() -> Path:
+    """
+    Resolve the workspace root once per process.
+
+    Returns:
+        The task-runner workspace if it exists, otherwise the current directory
+    """
+    if TASK_RUNNER_WORKSPACE.exists():
+        return TASK_RUNNER_WORKSPACE
+    return Path.cwd()
@@ -13,14 +13,21 @@ from typing import List, Dict, Any
 import json
 from pathlib import Path
 
-from dotenv import load_dotenv
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from flows.enrich.utils.env import load_env
+from flows.enrich.utils.paths import get_workspace_dir
 
 # Load environment variables - override to replace system env vars with .env values
-load_dotenv(override=True)
+load_env(override=True)
 
 # Configure logging
 logging.basicConfig(
@@ -35,10 +42,7 @@ class NavidromeDataIngestion:
 
     def __init__(self):
         # Use absolute path for task-runner compatibility
-        workspace_dir = Path("/home/runner/workspace")
-        if not workspace_dir.exists():
-            workspace_dir = Path.cwd()
-        self.data_dir = workspace_dir / "data"
+        self.data_dir = get_workspace_dir() / "data"
         self.raw_data_dir = self.data_dir / "raw" / "recently_played" / "detail"
 
         # Ensure directories exist
@@ -243,8 +247,11 @@ class NavidromeDataIngestion:
         filename = f"navidrome_recently_played_{timestamp}.json"
         filepath = self.raw_data_dir / filename
 
-        with open(filepath, "w") as f:
-            json.dump(data, f, default=str)
+        if orjson is not None:
+            filepath.write_bytes(orjson.dumps(data, default=str))
+        else:
+            with open(filepath, "w") as f:
+                json.dump(data, f, default=str)
 
         logger.info(f"Saved {len(data)} records to {filepath}")
         return str(filepath)
@@ -309,7 +316,10 @@ def main():
     result = ingestor.run_ingestion()
 
     # Print result for logging/monitoring
-    print(json.dumps(result, indent=2, default=str))
+    if orjson is not None:
+        print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
+    else:
+        print(json.dumps(result, indent=2, default=str))
 
     # Exit with appropriate code
     if result.get("status") == "success" or result.get("status") == "no_data":
@@ -6,24 +6,33 @@ and storing them for further processing.
 
 import os
 import sys
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Any
 import json
 from pathlib import Path
 import glob
 
-from dotenv import load_dotenv
 import polars as pl
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from flows.enrich.utils.api_clients import SpotifyAPIClient
+from flows.enrich.utils.env import load_env
+from flows.enrich.utils.paths import get_workspace_dir
 
 # Load environment variables
-load_dotenv()
+load_env()
 
 # Configure logging
 logging.basicConfig(
@@ -38,10 +47,7 @@ class SpotifyDataIngestion:
 
     def __init__(self):
         # Use absolute path for task-runner compatibility
-        workspace_dir = Path("/home/runner/workspace")
-        if not workspace_dir.exists():
-            workspace_dir = Path.cwd()
-        self.data_dir = workspace_dir / "data"
+        self.data_dir = get_workspace_dir() / "data"
         self.raw_data_dir = self.data_dir / "raw" / "recently_played" / "detail"
 
         # Ensure directories exist
@@ -141,12 +147,22 @@ class SpotifyDataIngestion:
         filename = f"spotify_recently_played_{timestamp}.json"
         filepath = self.raw_data_dir / filename
 
-        with open(filepath, "w") as f:
-            json.dump(data, f, default=str)
+        if orjson is not None:
+            filepath.write_bytes(orjson.dumps(data, default=str))
+        else:
+            with open(filepath, "w") as f:
+                json.dump(data, f, default=str)
 
         logger.info(f"Saved {len(data)} records to {filepath}")
         return str(filepath)
 
+    @staticmethod
+    def _load_json_file(json_file: str) -> Any:
+        """Read and parse one raw JSON file."""
+        with open(json_file, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
     def consolidate_to_csv(self) -> str:
         """Consolidate all JSON files from recently_played/detail directory to a single CSV."""
         logger.info("Starting consolidation of JSON files to CSV")
@@ -162,16 +178,22 @@ class SpotifyDataIngestion:
 
         logger.info(f"Found {len(json_files)} JSON files to consolidate")
 
-        # Collect all data from JSON files
+        # Collect all data from JSON files. The reads are I/O bound, so they
+        # are fetched on a small thread pool; results keep the glob order
+        with ThreadPoolExecutor(max_workers=min(8, len(json_files))) as executor:
+            futures = [
+                executor.submit(self._load_json_file, json_file)
+                for json_file in json_files
+            ]
+
         all_data = []
-        for json_file in json_files:
+        for json_file, future in zip(json_files, futures):
             try:
-                with open(json_file, "r") as f:
-                    file_data = json.load(f)
-                    if isinstance(file_data, list):
-                        all_data.extend(file_data)
-                    else:
-                        all_data.append(file_data)
+                file_data = future.result()
+                if isinstance(file_data, list):
+                    all_data.extend(file_data)
+                else:
+                    all_data.append(file_data)
                 logger.debug(f"Loaded data from {json_file}")
             except Exception as e:
                 logger.error(f"Error reading {json_file}: {e}")
@@ -224,16 +246,10 @@ class SpotifyDataIngestion:
             )
 
             # Step 1: Remove exact duplicates by grouping on track_id and played_at (same play event)
-            df_step1 = (
-                df.with_row_index()
-                .with_columns(
-                    pl.col("index")
-                    .first()
-                    .over(["track_id", "played_at"])
-                    .alias("keep_row")
-                )
-                .filter(pl.col("index") == pl.col("keep_row"))
-                .drop(["index", "keep_row"])
+            # A hash-based unique keeps the first row per key in one pass,
+            # without a row index and window over the whole frame
+            df_step1 = df.unique(
+                subset=["track_id", "played_at"], keep="first", maintain_order=True
             )
 
             step1_count = len(df_step1)
@@ -328,9 +344,16 @@ class SpotifyDataIngestion:
             logger.error(f"Error writing CSV file: {e}")
             raise
 
-    def run_ingestion(self) -> Dict[str, Any]:
-        """Run the complete ingestion process."""
-        start_time = datetime.now(timezone.utc)
+    def run_ingestion(self, consolidate: bool = True) -> Dict[str, Any]:
+        """
+        Run the complete ingestion process.
+
+        Args:
+            consolidate: Rebuild the consolidated CSV after saving new data.
+                Callers that consolidate separately (the Track Ingestion
+                workflow does so once after all sources) can skip it.
+        """
+        start_time = time.perf_counter()
         logger.info("Starting Spotify data ingestion")
 
         try:
@@ -351,7 +374,7 @@ class SpotifyDataIngestion:
             saved_file = self.save_raw_data(data)
 
             # Consolidate all JSON files to CSV
-            csv_file = self.consolidate_to_csv()
+            csv_file = self.consolidate_to_csv() if consolidate else None
 
             # Update cursor with max played_at + 1 to prevent duplicates
             if data:
@@ -360,8 +383,7 @@ class SpotifyDataIngestion:
                 new_after = str(int(dt.timestamp() * 1000) + 1)
                 self.save_cursor(new_after)
 
-            end_time = datetime.now(timezone.utc)
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
 
             result = {
                 "status": "success",
@@ -385,7 +407,10 @@ def main():
     result = ingestor.run_ingestion()
 
     # Print result for logging/monitoring
-    print(json.dumps(result, indent=2, default=str))
+    if orjson is not None:
+        print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
+    else:
+        print(json.dumps(result, indent=2, default=str))
 
     # Exit with appropriate code
     if result.get("status") == "success" or result.get("status") == "no_data":
@@ -1,10 +1,16 @@
-import json
 import shutil
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import polars as pl
 
+# Columns identifying a single listen in tracks_played
+PLAY_KEY_COLUMNS = ["user_id", "track_id", "played_at"]
+
+# Number of appended batch files tracks_played may hold before it is
+# compacted back into a single file
+COMPACT_AFTER_FILES = 48
+
 
 def harmonize_dataframe_schemas(dataframes):
     """
@@ -43,7 +49,103 @@ def harmonize_dataframe_schemas(dataframes):
     return harmonized_dfs
 
 
+def align_to_table_schema(df, table_schema):
+    """
+    Reorder and cast a batch to an existing table's schema, adding any
+    columns the batch lacks as nulls.
+
+    Args:
+        df: polars DataFrame whose columns are a subset of the table's
+        table_schema: Column name to dtype mapping of the existing table
+
+    Returns:
+        polars DataFrame with exactly the table's columns, in order
+    """
+    return df.select(
+        pl.col(col).cast(dtype) if col in df.columns else pl.lit(None, dtype).alias(col)
+        for col, dtype in table_schema.items()
+    )
+
+
+def compact_table(table_path, max_files=COMPACT_AFTER_FILES):
+    """
+    Rewrite tracks_played as a single parquet file once appended batches
+    pile up past max_files.
+
+    Args:
+        table_path: Directory holding the table's parquet files
+        max_files: Number of files to tolerate before compacting
+
+    Returns:
+        True if the table was compacted
+    """
+    parquet_files = list(table_path.glob("*.parquet"))
+    if len(parquet_files) <= max_files:
+        return False
+
+    combined_df = pl.read_parquet(parquet_files)
+    for pq_file in parquet_files:
+        pq_file.unlink()
+    combined_df.write_parquet(
+        table_path / "tracks_played.parquet",
+        compression="snappy",
+        row_group_size=10000,
+    )
+    return True
+
+
+def count_table_rows(table_path):
+    """
+    Count the rows of a parquet table from its file metadata.
+
+    Args:
+        table_path: Directory holding the table's parquet files
+
+    Returns:
+        Total number of rows across all parquet files
+    """
+    parquet_files = list(table_path.glob("*.parquet"))
+    if not parquet_files:
+        return 0
+    return pl.scan_parquet(parquet_files).select(pl.len()).collect().item()
+
+
+def cleanup_processed_files(processed_path, retention_days=7):
+    """
+    Delete processed Spotify JSON files older than the retention window.
+
+    Args:
+        processed_path: Directory holding already-loaded JSON files
+        retention_days: Number of days of processed files to keep
+    """
+    current_time = datetime.now(timezone.utc)
+    cutoff_date = current_time - timedelta(days=retention_days)
+
+    for processed_file in processed_path.glob("*.json"):
+        # Parse date from filename: spotify_recently_played_YYYYMMDD_HHMMSS.json
+        filename = processed_file.name
+        if filename.startswith("spotify_recently_played_") and filename.endswith(
+            ".json"
+        ):
+            date_str = filename.split("_")[3]  # YYYYMMDD
+            try:
+                file_date = datetime.strptime(date_str, "%Y%m%d").replace(
+                    tzinfo=timezone.utc
+                )
+                if file_date < cutoff_date:
+                    processed_file.unlink()
+            except ValueError:
+                pass  # Skip if date parsing fails
+
+
 def main():
+    """
+    Load raw recently played JSON files into the tracks_played parquet table.
+
+    Returns:
+        Dict with the number of files processed, new records loaded and total
+        records in tracks_played, so in-process callers get metrics directly
+    """
     # Define paths using absolute path for task-runner compatibility
     workspace_dir = Path("/home/runner/workspace")
     if not workspace_dir.exists():
@@ -58,7 +160,17 @@ def main():
 
     # Step 1: Read all JSON files from detail folder
     json_files = list(detail_path.glob("*.json"))
-    new_data_frames = []
+
+    if not json_files:
+        # Nothing new to load: leave tracks_played as it is rather than
+        # reading and rewriting the whole table, and count its rows from
+        # the parquet metadata
+        cleanup_processed_files(processed_path)
+        return {
+            "files_processed": 0,
+            "records_loaded": 0,
+            "total_records": count_table_rows(src_tracks_path),
+        }
 
     # Define explicit schema for the DataFrame to handle mixed types
     # Use Float64 for numeric columns first (handles None gracefully), then cast to Int64
@@ -81,96 +193,99 @@ def main():
         "play_source": pl.Utf8,
     }
 
-    for json_file in json_files:
-        with open(json_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        df = pl.DataFrame(data, schema=schema)
-
-        # Cast numeric columns to Int64 to match parquet schema (None becomes null)
-        df = df.with_columns(
-            pl.col("duration_ms").cast(pl.Int64),
-            pl.col("popularity").cast(pl.Int64),
-        )
+    # Parse each JSON array with Polars' native reader rather than building
+    # Python dicts first; every file shares the explicit schema, so the
+    # casts and renames below run as one lazy plan over the combined frame
+    new_lf = pl.concat(
+        [pl.read_json(json_file, schema=schema) for json_file in json_files]
+    ).lazy()
 
-        # Rename columns to match existing schema (only if they exist)
-        rename_mapping = {}
-        if "uri" in df.columns:
-            rename_mapping["uri"] = "track_uri"
-        if "request_after" in df.columns:
-            rename_mapping["request_after"] = "request_cursor"
-        if rename_mapping:
-            df = df.rename(rename_mapping)
-
-        # Cast played_at to datetime (only if it exists)
-        # Handle both formats: "2026-01-04T02:55:58.123Z" (Spotify) and "2026-01-04T02:55:58+00:00Z" (Navidrome)
-        if "played_at" in df.columns:
-            df = df.with_columns(
-                pl.col("played_at")
-                .str.strip_chars("Z")  # Remove trailing Z to handle both formats
-                .str.strptime(pl.Datetime, "%Y-%m-%dT%H:%M:%S%z", strict=False)
-                .dt.replace_time_zone("UTC")
-                .dt.cast_time_unit("us")
-            )
-        new_data_frames.append(df)
+    # Cast numeric columns to Int64 to match parquet schema (None becomes null)
+    # and parse played_at. Handle both formats: "2026-01-04T02:55:58.123Z"
+    # (Spotify) and "2026-01-04T02:55:58+00:00Z" (Navidrome)
+    new_lf = new_lf.with_columns(
+        pl.col("duration_ms").cast(pl.Int64),
+        pl.col("popularity").cast(pl.Int64),
+        pl.col("played_at")
+        .str.strip_chars("Z")  # Remove trailing Z to handle both formats
+        .str.strptime(pl.Datetime, "%Y-%m-%dT%H:%M:%S%z", strict=False)
+        .dt.replace_time_zone("UTC")
+        .dt.cast_time_unit("us"),
+    )
+
+    # Rename columns to match existing schema
+    new_lf = new_lf.rename({"uri": "track_uri", "request_after": "request_cursor"})
 
-    if new_data_frames:
-        harmonized_dfs = harmonize_dataframe_schemas(new_data_frames)
-        new_df = pl.concat(harmonized_dfs)
-    else:
-        new_df = pl.DataFrame()
+    new_df = new_lf.collect()
 
-    # Step 2: Read existing parquet files
+    # Step 2: Drop plays already in tracks_played. New rows are appended as
+    # their own file, so the scan of the existing table reads only the key
+    # columns
     parquet_files = list(src_tracks_path.glob("*.parquet"))
-    if parquet_files:
-        existing_df = pl.read_parquet(parquet_files)
-    else:
-        existing_df = pl.DataFrame()
-
-    # Step 3: Concatenate new data with existing
-    if not existing_df.is_empty() and not new_df.is_empty():
-        harmonized_dfs = harmonize_dataframe_schemas([existing_df, new_df])
-        combined_df = pl.concat(harmonized_dfs)
-    elif not existing_df.is_empty():
-        combined_df = existing_df
-    else:
-        combined_df = new_df
-
-    # Step 4: Write back to parquet with optimization
-    if not combined_df.is_empty():
-        # Remove old parquet files
-        for pq_file in parquet_files:
-            pq_file.unlink()
-
-        # Write optimized parquet
-        combined_df.write_parquet(
-            src_tracks_path / "tracks_played.parquet",
-            compression="snappy",
-            row_group_size=10000,
+    table_schema = pl.read_parquet_schema(parquet_files[0]) if parquet_files else None
+    if table_schema is not None and not new_df.is_empty():
+        # Overlapping raw files can repeat listens that were loaded on an
+        # earlier run; one hash anti-join on the play key drops them. Only
+        # plays inside the batch's played_at range can match, and filtering
+        # in the scan lets parquet statistics skip older row groups
+        played_at = new_df["played_at"]
+        existing_keys = (
+            pl.scan_parquet(parquet_files)
+            .select(PLAY_KEY_COLUMNS)
+            .filter(pl.col("played_at").is_between(played_at.min(), played_at.max()))
+            .cast({col: new_df.schema[col] for col in PLAY_KEY_COLUMNS})
+        )
+        new_df = (
+            new_df.lazy().join(existing_keys, on=PLAY_KEY_COLUMNS, how="anti").collect()
         )
 
-    # Step 5: Move processed JSON files
+    # Step 3: Write the new plays
+    if not new_df.is_empty():
+        if table_schema is None:
+            new_df.write_parquet(
+                src_tracks_path / "tracks_played.parquet",
+                compression="snappy",
+                row_group_size=10000,
+            )
+        elif set(new_df.columns) <= set(table_schema):
+            # Append without touching existing files; matching the table's
+            # column order and types keeps the files readable as one table
+            batch_name = datetime.now(timezone.utc).strftime(
+                "tracks_played_%Y%m%d_%H%M%S_%f.parquet"
+            )
+            align_to_table_schema(new_df, table_schema).write_parquet(
+                src_tracks_path / batch_name,
+                compression="snappy",
+                row_group_size=10000,
+            )
+            # Compact only when enough batches have accumulated instead of
+            # rewriting the table on every run
+            compact_table(src_tracks_path)
+        else:
+            # The batch adds columns the table lacks, so rewrite the whole table
+            # with a harmonized schema
+            existing_df = pl.read_parquet(parquet_files)
+            combined_df = pl.concat(harmonize_dataframe_schemas([existing_df, new_df]))
+            for pq_file in parquet_files:
+                pq_file.unlink()
+            combined_df.write_parquet(
+                src_tracks_path / "tracks_played.parquet",
+                compression="snappy",
+                row_group_size=10000,
+            )
+
+    # Step 4: Move processed JSON files
     for json_file in json_files:
         shutil.move(str(json_file), str(processed_path / json_file.name))
 
-    # Step 6: Clean up old processed files
-    current_time = datetime.now(timezone.utc)
-    cutoff_date = current_time - timedelta(days=7)
+    # Step 5: Clean up old processed files
+    cleanup_processed_files(processed_path)
 
-    for processed_file in processed_path.glob("*.json"):
-        # Parse date from filename: spotify_recently_played_YYYYMMDD_HHMMSS.json
-        filename = processed_file.name
-        if filename.startswith("spotify_recently_played_") and filename.endswith(
-            ".json"
-        ):
-            date_str = filename.split("_")[3]  # YYYYMMDD
-            try:
-                file_date = datetime.strptime(date_str, "%Y%m%d").replace(
-                    tzinfo=timezone.utc
-                )
-                if file_date < cutoff_date:
-                    processed_file.unlink()
-            except ValueError:
-                pass  # Skip if date parsing fails
+    return {
+        "files_processed": len(json_files),
+        "records_loaded": len(new_df),
+        "total_records": count_table_rows(src_tracks_path),
+    }
 
 
 if __name__ == "__main__":
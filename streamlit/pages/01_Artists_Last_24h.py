@@ -6,6 +6,7 @@ Displays listening activity metrics and top artists for the last 24-hour period.
 import logging
 from datetime import datetime
 
+import plotly.graph_objects as go
 import polars as pl
 import streamlit as st
 from streamlit.logger import get_logger
@@ -14,14 +15,14 @@ from streamlit.logger import get_logger
 from config import (
     PAGE_ICON,
     LAYOUT,
+    REFRESH_CACHE_TTL,
     TOP_ARTISTS_LIMIT,
 )
 
 # Import utils
 from utils.db_connection import (
     get_last_24h_tracks,
-    get_artist_aggregates,
-    get_tracks_for_artist,
+    get_listening_summary,
 )
 
 logger = get_logger(__name__)
@@ -66,6 +67,12 @@ if "tracks_data" not in st.session_state:
     st.session_state.tracks_data = None
 if "selected_artist" not in st.session_state:
     st.session_state.selected_artist = None
+if "tracks_by_artist" not in st.session_state:
+    st.session_state.tracks_by_artist = None
+if "summary" not in st.session_state:
+    st.session_state.summary = None
+if "stats_by_artist" not in st.session_state:
+    st.session_state.stats_by_artist = None
 
 
 def format_timestamp(dt) -> str:
@@ -75,32 +82,51 @@ def format_timestamp(dt) -> str:
     return dt.strftime("%Y-%m-%d %H:%M:%S")
 
 
-def refresh_data():
-    """Refresh the data from DuckDB."""
+@st.cache_data(ttl=REFRESH_CACHE_TTL, show_spinner=False)
+def load_last_24h_tracks():
+    """Fetch the last 24 hours of tracks, shared across sessions for the TTL."""
+    return get_last_24h_tracks()
+
+
+def refresh_data(force: bool = False):
+    """
+    Refresh the data from DuckDB.
+
+    Args:
+        force: Bypass the cached query result (the Refresh button)
+    """
+    if force:
+        load_last_24h_tracks.clear()
+
     with st.spinner("Loading data..."):
         try:
-            data = get_last_24h_tracks()
+            data = load_last_24h_tracks()
+            if data is None:
+                # Don't keep serving a failed query until the TTL expires
+                load_last_24h_tracks.clear()
             if data is None or len(data) == 0:
                 st.warning("⚠️ No tracks found in the last 24 hours")
                 return
 
             st.session_state.tracks_data = data
+            st.session_state.tracks_by_artist = None
+            st.session_state.summary = None
+            st.session_state.stats_by_artist = None
             st.session_state.last_refresh = datetime.now()
         except Exception as e:
             st.error(f"❌ Failed to load data: {e}")
             logger.error(f"Data refresh failed: {e}", exc_info=True)
 
 
-def display_kpi_cards(data):
+def display_kpi_cards(kpis):
     """Display KPI cards with key metrics."""
-    if data is None or len(data) == 0:
+    if not kpis:
         st.warning("No data available for the last 24 hours")
         return
 
-    # Calculate metrics
-    total_minutes = data["minutes_played"].sum()
-    total_tracks = len(data)
-    total_artists = data["artist"].n_unique()
+    total_minutes = kpis["total_minutes"]
+    total_tracks = kpis["total_tracks"]
+    total_artists = kpis["total_artists"]
 
     # Display metrics in columns
     col1, col2, col3 = st.columns(3)
@@ -127,33 +153,26 @@ def display_kpi_cards(data):
         )
 
 
-def display_artists_chart(data):
-    """Display horizontal bar chart of artists by minutes played."""
-    if data is None or len(data) == 0:
-        st.info("No artist data available")
-        return
-
-    # Aggregate by artist
-    artist_data = get_artist_aggregates(data)
-
-    if len(artist_data) == 0:
-        st.info("No artist data available")
-        return
-
-    # Get top N artists
-    top_artists = artist_data.head(TOP_ARTISTS_LIMIT)
+@st.cache_resource(max_entries=8)
+def build_artists_figure(top_artists):
+    """
+    Build the top artists bar chart.
 
-    # Create interactive chart with Plotly
-    import plotly.graph_objects as go
+    Args:
+        top_artists: Tuple of (artist, total_minutes) pairs. The figure is
+            cached on it, so reruns over unchanged data reuse the figure
+    """
+    artists = [artist for artist, _ in top_artists]
+    minutes = [total_minutes for _, total_minutes in top_artists]
 
     fig = go.Figure(
         data=[
             go.Bar(
-                x=top_artists["total_minutes"],
-                y=top_artists["artist"],
+                x=minutes,
+                y=artists,
                 orientation="h",
                 marker=dict(
-                    color=top_artists["total_minutes"],
+                    color=minutes,
                     colorscale="Viridis",
                     showscale=True,
                     colorbar=dict(
@@ -161,7 +180,7 @@ def display_artists_chart(data):
                         tickfont=dict(color="black", size=11),
                     ),
                 ),
-                text=[f"{m:.0f} min" for m in top_artists["total_minutes"]],
+                text=[f"{m:.0f} min" for m in minutes],
                 textposition="outside",
                 textfont=dict(color="black", size=12),
                 hovertemplate="<b>%{y}</b><br>%{x:.0f} minutes<extra></extra>",
@@ -185,6 +204,25 @@ def display_artists_chart(data):
     fig.update_yaxes(autorange="reversed", tickfont=dict(color="black", size=11))
     fig.update_xaxes(tickfont=dict(color="black", size=11))
 
+    return fig
+
+
+def display_artists_chart(data, artist_data):
+    """Display horizontal bar chart of artists by minutes played."""
+    if data is None or len(data) == 0:
+        st.info("No artist data available")
+        return
+
+    if len(artist_data) == 0:
+        st.info("No artist data available")
+        return
+
+    # Create interactive chart with Plotly; artist_data already holds only
+    # the top TOP_ARTISTS_LIMIT artists
+    fig = build_artists_figure(
+        tuple(artist_data.select("artist", "total_minutes").iter_rows())
+    )
+
     st.plotly_chart(fig, width="stretch")
 
     # Artist details modal
@@ -195,22 +233,37 @@ def display_artists_chart(data):
     with col1:
         selected_artist = st.selectbox(
             "Select an artist to view their tracks",
-            options=top_artists["artist"].to_list(),
+            options=artist_data["artist"].to_list(),
             key="artist_selector",
         )
 
     if selected_artist:
-        artist_tracks = get_tracks_for_artist(data, selected_artist)
+        # Split the tracks by artist once per refresh, so picking another
+        # artist is a dict lookup rather than a filter over every track.
+        # The query already orders tracks by played_at descending
+        if st.session_state.tracks_by_artist is None:
+            st.session_state.tracks_by_artist = data.select(
+                "artist",
+                "track_name",
+                "album",
+                "minutes_played",
+                "played_at",
+                "popularity",
+            ).partition_by("artist", as_dict=True, include_key=False)
+        artist_tracks = st.session_state.tracks_by_artist.get(
+            (selected_artist,), pl.DataFrame()
+        )
 
         if len(artist_tracks) > 0:
-            # Display artist info
-            artist_stats = artist_data.filter(pl.col("artist") == selected_artist).row(
-                0, named=True
-            )
-            total_min, track_count = (
-                artist_stats["total_minutes"],
-                artist_stats["track_count"],
-            )
+            # Display artist info from the per-refresh stats lookup
+            if st.session_state.stats_by_artist is None:
+                st.session_state.stats_by_artist = {
+                    artist: (total_minutes, track_count)
+                    for artist, total_minutes, track_count in artist_data.select(
+                        "artist", "total_minutes", "track_count"
+                    ).iter_rows()
+                }
+            total_min, track_count = st.session_state.stats_by_artist[selected_artist]
 
             col1, col2, col3 = st.columns(3)
             with col1:
@@ -224,25 +277,19 @@ def display_artists_chart(data):
             # Display tracks in a table
             st.markdown(f"#### Tracks by {selected_artist}")
 
-            # Format for display
-            display_df = (
-                artist_tracks[
-                    ["track_name", "album", "minutes_played", "played_at", "popularity"]
-                ]
-                .rename(
-                    {
-                        "track_name": "Track",
-                        "album": "Album",
-                        "minutes_played": "Minutes",
-                        "played_at": "Played At",
-                        "popularity": "Popularity",
-                    }
-                )
-                .with_columns(pl.col("Minutes").round(2))
-            )
-
+            # Label and round the columns at render time rather than building
+            # a renamed, rounded copy of the frame on every rerun
             st.dataframe(
-                display_df,
+                artist_tracks,
+                column_config={
+                    "track_name": "Track",
+                    "album": "Album",
+                    "minutes_played": st.column_config.NumberColumn(
+                        "Minutes", format="%.2f"
+                    ),
+                    "played_at": "Played At",
+                    "popularity": "Popularity",
+                },
                 width="stretch",
                 hide_index=True,
             )
@@ -255,7 +302,7 @@ def main():
     with st.sidebar:
         st.markdown("### Controls")
         if st.button("🔄 Refresh Data", width="stretch"):
-            refresh_data()
+            refresh_data(force=True)
 
         st.markdown("---")
         if st.session_state.last_refresh:
@@ -271,12 +318,19 @@ def main():
 
     # Display KPIs
     if st.session_state.tracks_data is not None:
-        display_kpi_cards(st.session_state.tracks_data)
+        # Totals and per-artist aggregates are computed once per refresh
+        if st.session_state.summary is None:
+            st.session_state.summary = get_listening_summary(
+                st.session_state.tracks_data, top_artists=TOP_ARTISTS_LIMIT
+            )
+        kpis, artist_data = st.session_state.summary
+
+        display_kpi_cards(kpis)
 
         st.markdown("---")
 
         # Display chart and artist details
-        display_artists_chart(st.session_state.tracks_data)
+        display_artists_chart(st.session_state.tracks_data, artist_data)
 
 
 if __name__ == "__main__":
@@ -177,7 +177,8 @@ def display_genre_treemap(start_date, end_date, genres):
             st.info("ℹ️ No genres found for the selected date range")
             return None
 
-        logger.info(f"Genre data shape: {data.shape}, columns: {data.columns}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Genre data shape: %s, columns: %s", data.shape, data.columns)
 
         # Create hover text with artist information
         genre_list = data["genre"].to_list()
@@ -83,65 +83,57 @@ def get_last_24h_tracks():
         return None
 
 
-def get_artist_aggregates(df):
-    """
-    Aggregate track data by artist, calculating total minutes and track count.
-
-    Args:
-        df: Polars DataFrame from get_last_24h_tracks()
-
-    Returns:
-        Polars DataFrame with columns: artist, artist_id, total_minutes, track_count
-        Sorted by total_minutes descending
-    """
-    if df is None or len(df) == 0:
-        return pl.DataFrame()
-
-    try:
-        result = (
-            df.group_by(["artist"])
-            .agg(
-                pl.col("minutes_played").sum().alias("total_minutes"),
-                pl.col("artist").count().alias("track_count"),
-            )
-            .sort("total_minutes", descending=True)
+def _artist_aggregates_plan(lf, limit=None):
+    """Lazy per-artist totals, sorted by total_minutes descending."""
+    plan = (
+        lf.group_by(["artist"])
+        .agg(
+            pl.col("minutes_played").sum().alias("total_minutes"),
+            pl.col("artist").count().alias("track_count"),
         )
-        return result
+        .sort("total_minutes", descending=True)
+    )
+    # Polars plans a sort followed by a head as a top-k
+    return plan.head(limit) if limit is not None else plan
 
-    except Exception as e:
-        logger.error(f"Failed to aggregate artist data: {e}")
-        return pl.DataFrame()
 
-
-def get_tracks_for_artist(df, artist: str):
+def get_listening_summary(df, top_artists=None):
     """
-    Get all tracks for a specific artist from the last 24h data.
+    Compute the headline totals and per-artist aggregates in one pass.
+
+    Both plans are collected together so Polars runs them in parallel over
+    the same frame.
 
     Args:
         df: Polars DataFrame from get_last_24h_tracks()
-        artist: Artist name to filter
+        top_artists: Only keep this many artists with the most minutes
+            (default: all)
 
     Returns:
-        Polars DataFrame with columns: track_name, album, minutes_played,
-                                       played_at, popularity
-        Sorted by played_at descending
+        Tuple of (dict with total_minutes, total_tracks, total_artists;
+        DataFrame with columns artist, total_minutes, track_count, sorted by
+        total_minutes descending)
     """
     if df is None or len(df) == 0:
-        return pl.DataFrame()
+        return {}, pl.DataFrame()
 
     try:
-        result = (
-            df.filter(pl.col("artist") == artist)
-            .select(
-                ["track_name", "album", "minutes_played", "played_at", "popularity"]
-            )
-            .sort("played_at", descending=True)
+        lf = df.lazy()
+        kpis, artist_data = pl.collect_all(
+            [
+                lf.select(
+                    pl.col("minutes_played").sum().alias("total_minutes"),
+                    pl.len().alias("total_tracks"),
+                    pl.col("artist").n_unique().alias("total_artists"),
+                ),
+                _artist_aggregates_plan(lf, limit=top_artists),
+            ]
         )
-        return result
+        return kpis.row(0, named=True), artist_data
 
     except Exception as e:
-        logger.error(f"Failed to get tracks for artist {artist}: {e}")
-        return pl.DataFrame()
+        logger.error(f"Failed to summarize listening data: {e}")
+        return {}, pl.DataFrame()
 
 
 def get_geographic_data(start_date, end_date):
@@ -0,0 +1,131 @@
+"""
+Tests for running the Spotify artist and album enrichment paths together.
+"""
+
+import threading
+
+import polars as pl
+
+from flows.enrich.spotify_processor import SpotifyProcessor
+from flows.enrich.utils.api_clients import SpotifyAPIClient
+from flows.enrich.utils.data_writer import ParquetDataWriter
+from flows.enrich.utils.duckdb_queries import DuckDBQueryEngine
+
+
+def _write_source_tables(base_path):
+    """Write tracks_played, spotify_* and mbz_artist_info fixtures."""
+    tables = {
+        "tracks_played": pl.DataFrame(
+            {
+                "artist_id": ["ar1", "ar2", "ar3"],
+                "artist": ["Artist 1", "Artist 2", "Artist 3"],
+                "album_id": ["al1", "al2", "al3"],
+            }
+        ),
+        "spotify_artists": pl.DataFrame(
+            {
+                "artist_id": ["ar1"],
+                "artist_name": ["Artist 1"],
+                "artist_mbid": [None],
+                "artist_popularity": [50.0],
+            },
+            schema_overrides={
+                "artist_mbid": pl.Utf8,
+                "artist_popularity": pl.Float32,
+            },
+        ),
+        "spotify_albums": pl.DataFrame({"album_id": ["al1"]}),
+        "mbz_artist_info": pl.DataFrame(
+            {"spotify_id": ["ar1", "ar2"], "id": ["mbid-1", "mbid-2"]}
+        ),
+    }
+    for table_name, df in tables.items():
+        table_path = base_path / table_name
+        table_path.mkdir()
+        df.write_parquet(table_path / f"{table_name}.parquet")
+
+
+def test_run_full_enrichment_overlaps_artists_and_albums(tmp_path, monkeypatch):
+    """Artist and album enrichment run at the same time and both land."""
+    _write_source_tables(tmp_path)
+
+    # Both API calls wait for each other, so the test only passes when the
+    # album thread is running while the artist path is
+    both_fetching = threading.Barrier(2, timeout=10)
+
+    def get_artists_batch(self, artist_ids, batch_size=50):
+        both_fetching.wait()
+        return [
+            {"id": artist_id, "name": artist_id.upper(), "popularity": 10}
+            for artist_id in artist_ids
+        ]
+
+    def get_albums_batch(self, album_ids, batch_size=20):
+        both_fetching.wait()
+        return [
+            {
+                "id": album_id,
+                "name": album_id.upper(),
+                "album_type": "album",
+                "artists": [{"id": "ar1", "name": "Artist 1", "type": "artist"}],
+            }
+            for album_id in album_ids
+        ]
+
+    monkeypatch.setattr(SpotifyAPIClient, "get_artists_batch", get_artists_batch)
+    monkeypatch.setattr(SpotifyAPIClient, "get_albums_batch", get_albums_batch)
+
+    processor = SpotifyProcessor(
+        data_writer=ParquetDataWriter(str(tmp_path)),
+        client_id="client",
+        client_secret="secret",
+        refresh_token="refresh",
+    )
+    result = processor.run_full_enrichment()
+
+    assert result["overall_status"] == "success"
+    assert result["artist_enrichment"]["artists_processed"] == 2
+    assert result["album_enrichment"]["albums_processed"] == 2
+
+    artists = pl.read_parquet(tmp_path / "spotify_artists" / "*.parquet")
+    assert sorted(artists["artist_id"]) == ["ar1", "ar2", "ar3"]
+    mbids = dict(zip(artists["artist_id"], artists["artist_mbid"]))
+    assert mbids["ar1"] == "mbid-1"
+    assert mbids["ar2"] == "mbid-2"
+
+    albums = pl.read_parquet(tmp_path / "spotify_albums" / "*.parquet")
+    assert sorted(albums["album_id"]) == ["al1", "al2", "al3"]
+
+
+def test_query_engine_serves_artist_and_album_queries_concurrently(tmp_path):
+    """One engine answers the artist and album lookups from two threads."""
+    _write_source_tables(tmp_path)
+    engine = DuckDBQueryEngine(str(tmp_path))
+    start = threading.Barrier(2, timeout=10)
+    errors = []
+
+    def run(query, expected_ids, id_column):
+        try:
+            start.wait()
+            for _ in range(50):
+                ids = sorted(query()[id_column])
+                assert ids == expected_ids
+        except Exception as e:
+            errors.append(e)
+
+    threads = [
+        threading.Thread(
+            target=run,
+            args=(engine.get_missing_spotify_artists, ["ar2", "ar3"], "artist_id"),
+        ),
+        threading.Thread(
+            target=run,
+            args=(engine.get_missing_spotify_albums, ["al2", "al3"], "album_id"),
+        ),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []